@@ -7,9 +7,19 @@ from typing import TYPE_CHECKING, TypeAlias
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import config_validation as cv
 
-from .const import CONF_CAMERA_NAME, DOMAIN
+from .const import CONF_EXPORT_DIR, CONF_PRESENCE_LOG, CONF_PROBE_INTERVAL, DOMAIN
 from .coordinator import SharedCamCoordinator
-from .views import SharedCamEventsView, SharedCamStatusView
+from .export import SharedCamStatusExporter
+from .presence import async_get_presence_ingester
+from .probe import SharedCamProbe
+from .profiling import async_register_profile_service
+from .views import (
+    SharedCamAdmitView,
+    SharedCamEventsView,
+    SharedCamSnapshotView,
+    SharedCamStatusView,
+)
+from .websocket_api import async_register_websocket_commands
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -23,11 +33,17 @@ CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 # Typed config entry alias — runtime_data holds the coordinator for this camera.
 SharedCamConfigEntry: TypeAlias = ConfigEntry[SharedCamCoordinator]
 
+# Options only read at setup; changing any of them reloads the entry.
+RELOAD_OPTIONS = (CONF_EXPORT_DIR, CONF_PRESENCE_LOG, CONF_PROBE_INTERVAL)
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the SharedCam component."""
-    # hass.data[DOMAIN] is kept only for the one-time HTTP view registration guard.
+    # hass.data[DOMAIN] holds the one-time HTTP view registration guard and the
+    # integration-wide helpers (per-host reconcilers, SSE channels, limiter, profiler).
     hass.data.setdefault(DOMAIN, {})
+    async_register_profile_service(hass)
+    async_register_websocket_commands(hass)
     return True
 
 
@@ -37,37 +53,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: SharedCamConfigEntry) ->
 
     coordinator = SharedCamCoordinator(hass, entry)
 
-    # Initial poll — raises ConfigEntryNotReady if go2rtc is unreachable
-    await coordinator.async_config_entry_first_refresh()
-
-    # Re-register the stream if it was enabled before HA restarted.
+    # Track this camera in its host's reconciler before the first poll so an
+    # enabled stream lost to an HA or go2rtc restart is re-registered right away.
     # go2rtc has no persistent stream config (go2rtc.yaml has no static streams),
     # so all streams are lost when go2rtc restarts.
-    if entry.options.get("stream_enabled") and coordinator.data is None:
-        try:
-            await coordinator.async_enable_stream()
-            await coordinator.async_refresh()
-            _LOGGER.info(
-                "Re-registered go2rtc stream '%s' after HA restart",
-                entry.data[CONF_CAMERA_NAME],
-            )
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.warning(
-                "Failed to re-register stream '%s' after HA restart: %s",
-                entry.data[CONF_CAMERA_NAME],
-                err,
-            )
+    entry.async_on_unload(coordinator.reconciler.async_register(coordinator))
+
+    # Initial poll — raises ConfigEntryNotReady if go2rtc is unreachable
+    await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator on the entry itself (IQS: runtime-data rule).
     entry.runtime_data = coordinator
 
+    # Export mode: keep status/<camera>.json up to date for the Caddy sidecar.
+    if export_dir := entry.options.get(CONF_EXPORT_DIR):
+        exporter = SharedCamStatusExporter(hass, coordinator, export_dir)
+        entry.async_on_unload(exporter.async_start())
+
+    # Presence log: WebSocket opens/closes seen by Caddy update the viewer count
+    # between polls.
+    if presence_log := (entry.options.get(CONF_PRESENCE_LOG) or "").strip():
+        ingester = async_get_presence_ingester(hass, presence_log)
+        entry.async_on_unload(ingester.async_register(coordinator))
+
+    entry.async_on_unload(coordinator.admission.async_shutdown)
+    entry.async_on_unload(coordinator.async_close)
+
+    # Synthetic viewer probe feeding the latency sensors.
+    if probe_interval := int(entry.options.get(CONF_PROBE_INTERVAL) or 0):
+        probe = SharedCamProbe(hass, coordinator, probe_interval)
+        entry.async_on_unload(probe.async_start())
+
     # Register HTTP views once — they are shared across all config entries.
     if "_views_registered" not in hass.data[DOMAIN]:
         hass.http.register_view(SharedCamStatusView())
         hass.http.register_view(SharedCamEventsView())
+        hass.http.register_view(SharedCamSnapshotView())
+        hass.http.register_view(SharedCamAdmitView())
         hass.data[DOMAIN]["_views_registered"] = True
         _LOGGER.debug("SharedCam HTTP views registered")
 
+    # Options saved by the options flow, the switch and the reconciler all land
+    # here; only a change to a setup-time option needs a reload.
+    setup_options = {key: entry.options.get(key) for key in RELOAD_OPTIONS}
+
+    async def _async_options_updated(
+        hass: HomeAssistant, entry: SharedCamConfigEntry
+    ) -> None:
+        if any(entry.options.get(key) != value for key, value in setup_options.items()):
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -0,0 +1,106 @@
+"""Viewer admission control — cap concurrent viewers of a camera.
+
+The uplink only carries so many full-resolution viewers. With a viewer limit
+set, the free slots are the limit minus the live viewer count minus recent
+reservations. The viewer page reserves a slot before opening go2rtc's WebSocket
+and waits while the camera is full. A reservation is held until a go2rtc poll
+that started after it completes — that poll counts the new viewer — and only
+then released, so the viewer is neither missed nor counted twice. A reservation
+whose poll never arrives lapses after ADMIT_RESERVATION_TTL.
+
+Admission is cooperative: it governs the sample viewer page, not clients that
+open the WebSocket directly.
+"""
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import ADMIT_RESERVATION_TTL, CONF_MAX_VIEWERS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+
+class SharedCamAdmission:
+    """Slot accounting and reservations for one camera."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: SharedCamCoordinator) -> None:
+        """Initialise admission control."""
+        self.hass = hass
+        self.coordinator = coordinator
+        # (reserved, expires) monotonic times of outstanding reservations, oldest first.
+        self._reservations: deque[tuple[float, float]] = deque()
+        self._unsub_expiry: Callable[[], None] | None = None
+
+    @property
+    def max_viewers(self) -> int:
+        """Return the configured viewer limit; 0 means unlimited."""
+        return int(self.coordinator.config_entry.options.get(CONF_MAX_VIEWERS) or 0)
+
+    @property
+    def slots(self) -> int | None:
+        """Return free viewer slots, or None when there is no limit."""
+        if not (limit := self.max_viewers):
+            return None
+        self._prune()
+        return max(0, limit - self.coordinator.viewer_count - len(self._reservations))
+
+    @callback
+    def async_reserve(self) -> bool:
+        """Hold a slot for a viewer about to connect; False when the camera is full."""
+        slots = self.slots
+        if slots is None:
+            return True
+        if not slots:
+            return False
+        now = time.monotonic()
+        self._reservations.append((now, now + ADMIT_RESERVATION_TTL))
+        self._schedule_expiry()
+        self.coordinator.async_update_listeners()
+        return True
+
+    @callback
+    def async_poll_completed(self, fetched: float) -> None:
+        """Release reservations made before a poll fetched /api/streams.
+
+        `fetched` is the monotonic time the poll sent its request; its consumer
+        count already includes every viewer admitted before then.
+        """
+        while self._reservations and self._reservations[0][0] < fetched:
+            self._reservations.popleft()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        while self._reservations and self._reservations[0][1] <= now:
+            self._reservations.popleft()
+
+    @callback
+    def _schedule_expiry(self) -> None:
+        """Publish the freed slot when the oldest reservation lapses."""
+        if self._unsub_expiry is not None or not self._reservations:
+            return
+        delay = max(0.0, self._reservations[0][1] - time.monotonic())
+        self._unsub_expiry = async_call_later(self.hass, delay, self._async_expired)
+
+    @callback
+    def _async_expired(self, _now) -> None:
+        self._unsub_expiry = None
+        self._prune()
+        self._schedule_expiry()
+        self.coordinator.async_update_listeners()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending expiry timer."""
+        if self._unsub_expiry is not None:
+            self._unsub_expiry()
+            self._unsub_expiry = None
@@ -5,16 +5,17 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_CAMERA_NAME, CONF_FRIENDLY_NAME, DOMAIN
-from .coordinator import SharedCamCoordinator
+from .entity import SharedCamEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .coordinator import SharedCamCoordinator
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,13 +26,12 @@ async def async_setup_entry(
     async_add_entities([SharedCamEnabledBinarySensor(entry.runtime_data, entry)])
 
 
-class SharedCamEnabledBinarySensor(
-    CoordinatorEntity[SharedCamCoordinator], BinarySensorEntity
-):
+class SharedCamEnabledBinarySensor(SharedCamEntity, BinarySensorEntity):
     """Binary sensor that is ON when the stream key is present in go2rtc /api/streams."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:broadcast"
+    _watched_fields = frozenset({"enabled"})
 
     def __init__(
         self, coordinator: SharedCamCoordinator, entry: ConfigEntry
@@ -12,15 +12,30 @@ import voluptuous as vol
 
 from .const import (
     CONF_CAMERA_NAME,
+    CONF_EVENT_BURST_LIMIT,
+    CONF_EXPORT_DIR,
     CONF_FRIENDLY_NAME,
     CONF_FRIGATE_URL,
     CONF_GO2RTC_URL,
+    CONF_MAX_VIEWERS,
+    CONF_PRESENCE_LOG,
+    CONF_PROBE_INTERVAL,
+    CONF_RETIRED_STREAMS,
     CONF_SHOW_VIEWERS,
+    CONF_SSE_KEEPALIVE,
     CONF_STATUS_TEMPLATE,
+    CONF_STREAM_ENABLED,
+    CONF_SUB_STREAM,
+    CONF_SUB_STREAM_EGRESS,
+    CONF_SUB_STREAM_VIEWERS,
+    DEFAULT_EVENT_BURST_LIMIT,
     DEFAULT_FRIGATE_URL,
     DEFAULT_GO2RTC_URL,
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_SSE_KEEPALIVE,
     DOMAIN,
 )
+from .presence import TCP_PREFIX, parse_tcp_source
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +70,52 @@ def _get_frigate_data(hass) -> tuple[list[str], str | None]:
     return [], None
 
 
+def _carry_internal_options(
+    config_entry: config_entries.ConfigEntry, user_input: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the new options with the integration's own bookkeeping carried over.
+
+    Options are replaced wholesale on save and stream_enabled is not part of the
+    form — dropping it would make the reconciler remove an enabled stream. A sub
+    stream that is changed or cleared is added to retired_streams so the
+    reconciler deletes the old variant from go2rtc.
+    """
+    options = dict(user_input)
+    if CONF_STREAM_ENABLED in config_entry.options:
+        options[CONF_STREAM_ENABLED] = config_entry.options[CONF_STREAM_ENABLED]
+
+    retired = set(config_entry.options.get(CONF_RETIRED_STREAMS) or ())
+    old_sub = (config_entry.options.get(CONF_SUB_STREAM) or "").strip()
+    new_sub = (options.get(CONF_SUB_STREAM) or "").strip()
+    if old_sub and old_sub != new_sub:
+        retired.add(old_sub)
+    retired -= {new_sub, config_entry.data[CONF_CAMERA_NAME]}
+    if retired:
+        options[CONF_RETIRED_STREAMS] = sorted(retired)
+    return options
+
+
+def _validate_options(hass, user_input: dict[str, Any]) -> dict[str, str]:
+    """Return form errors for an options submission.
+
+    The export directory is written to by HA, so like any other integration that
+    writes files it must be covered by `allowlist_external_dirs` (which includes
+    <config>/www by default). The same goes for a presence log file HA reads;
+    a tcp:// presence source must name a valid port.
+    """
+    errors: dict[str, str] = {}
+    export_dir = (user_input.get(CONF_EXPORT_DIR) or "").strip()
+    if export_dir and not hass.config.is_allowed_path(export_dir):
+        errors[CONF_EXPORT_DIR] = "export_dir_not_allowed"
+    presence_log = (user_input.get(CONF_PRESENCE_LOG) or "").strip()
+    if presence_log.startswith(TCP_PREFIX):
+        if parse_tcp_source(presence_log) is None:
+            errors[CONF_PRESENCE_LOG] = "presence_log_invalid"
+    elif presence_log and not hass.config.is_allowed_path(presence_log):
+        errors[CONF_PRESENCE_LOG] = "presence_log_not_allowed"
+    return errors
+
+
 async def _validate_go2rtc_url(hass, url: str) -> str | None:
     """Try GET /api/streams and return an error key on failure, None on success."""
     try:
@@ -146,16 +207,22 @@ class SharedCamConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Present options form immediately after the user step."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(
-                title=self._entry_title,
-                data=self._validated_config,
-                options=user_input,
-            )
+            errors = _validate_options(self.hass, user_input)
+            if not errors:
+                return self.async_create_entry(
+                    title=self._entry_title,
+                    data=self._validated_config,
+                    options=user_input,
+                )
 
         return self.async_show_form(
             step_id="options",
-            data_schema=_OPTIONS_SCHEMA,
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA, user_input or {}
+            ),
+            errors=errors,
         )
 
     @classmethod
@@ -170,6 +237,57 @@ _OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_SHOW_VIEWERS, default=True): selector.BooleanSelector(),
         vol.Optional(CONF_STATUS_TEMPLATE): selector.TemplateSelector(),
+        vol.Optional(
+            CONF_SSE_KEEPALIVE, default=DEFAULT_SSE_KEEPALIVE
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=5,
+                max=120,
+                step=1,
+                unit_of_measurement="s",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(CONF_MAX_VIEWERS, default=0): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=1000, step=1, mode=selector.NumberSelectorMode.BOX
+            )
+        ),
+        vol.Optional(CONF_SUB_STREAM): selector.TextSelector(),
+        vol.Optional(CONF_SUB_STREAM_VIEWERS, default=0): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=100, step=1, mode=selector.NumberSelectorMode.BOX
+            )
+        ),
+        vol.Optional(CONF_SUB_STREAM_EGRESS, default=0): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=1_000_000,
+                step=1,
+                unit_of_measurement="kbit/s",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
+        vol.Optional(
+            CONF_EVENT_BURST_LIMIT, default=DEFAULT_EVENT_BURST_LIMIT
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0, max=1000, step=1, mode=selector.NumberSelectorMode.BOX
+            )
+        ),
+        vol.Optional(CONF_EXPORT_DIR): selector.TextSelector(),
+        vol.Optional(CONF_PRESENCE_LOG): selector.TextSelector(),
+        vol.Optional(
+            CONF_PROBE_INTERVAL, default=DEFAULT_PROBE_INTERVAL
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=3600,
+                step=1,
+                unit_of_measurement="s",
+                mode=selector.NumberSelectorMode.BOX,
+            )
+        ),
     }
 )
 
@@ -177,20 +295,30 @@ _OPTIONS_SCHEMA = vol.Schema(
 class SharedCamOptionsFlow(config_entries.OptionsFlow):
     """Options flow for SharedCam — configure the status Jinja2 template.
 
-    No config entry reload is needed: the template is read live from
-    entry.options on every /status request and at SSE connection open time.
+    Most options apply without a reload: the template is read live from
+    entry.options on every /status request and at SSE connection open time;
+    a new keepalive period applies from the camera's next SSE connection, and
+    a newly configured sub stream is registered by the reconciler on its next poll
+    and a replaced one deleted. A changed export directory, presence log or probe
+    interval reloads the entry (see the update listener in __init__.py).
     """
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Show the options form."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            errors = _validate_options(self.hass, user_input)
+            if not errors:
+                return self.async_create_entry(
+                    data=_carry_internal_options(self.config_entry, user_input)
+                )
 
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                _OPTIONS_SCHEMA, self.config_entry.options
+                _OPTIONS_SCHEMA, user_input or self.config_entry.options
             ),
+            errors=errors,
         )
@@ -13,6 +13,10 @@ DEFAULT_FRIGATE_URL = "rtsp://localhost:8554"
 
 SCAN_INTERVAL = timedelta(seconds=30)
 
+SERVICE_PROFILE = "profile"
+# Number of SharedCam functions listed in the log summary of a profile run.
+PROFILE_TOP_N = 25
+
 # Optional Jinja2 template (stored in entry.options) rendered to a plain string
 # and surfaced as "status" in the /status JSON endpoint and SSE stream.
 CONF_STATUS_TEMPLATE = "status_template"
@@ -20,3 +24,117 @@ CONF_STATUS_TEMPLATE = "status_template"
 # When False, the /status endpoint and SSE stream send `"viewers": null` instead
 # of the live count — useful when the owner doesn't want to expose viewer numbers.
 CONF_SHOW_VIEWERS = "show_viewers"
+
+# Seconds between `: keepalive` comments on idle SSE connections. One ticker per
+# camera writes them to every idle subscriber in a single pass.
+CONF_SSE_KEEPALIVE = "sse_keepalive"
+DEFAULT_SSE_KEEPALIVE = 15
+
+# Options key persisted by the switch so the desired stream state survives restarts;
+# the reconciler compares it with every go2rtc poll.
+CONF_STREAM_ENABLED = "stream_enabled"
+
+# Options key listing sub-stream variants that were replaced or cleared in the
+# options flow and may still be registered in go2rtc; the reconciler deletes them
+# and then drops them from the list.
+CONF_RETIRED_STREAMS = "retired_streams"
+
+# Reconciler backoff (seconds) between failed repair attempts of the same stream.
+RECONCILE_BACKOFF_MIN = 30
+RECONCILE_BACKOFF_MAX = 600
+
+# Producer stall: a stream with consumers attached whose producer received-byte
+# counter has not moved for STALL_POLLS consecutive poll intervals is re-registered
+# in go2rtc, backing off like the reconciler (RECONCILE_BACKOFF_*) while it stays
+# stalled.
+STALL_POLLS = 2
+
+# Number of previously-present streams that must vanish in a single poll for the
+# reconciler to treat it as a go2rtc restart rather than an isolated removal.
+# A host whose every enabled stream disappears at once always counts as a restart.
+RESTART_MIN_STREAMS = 2
+
+# Seconds to wait after a disable restart before polling the host again.
+RESTART_SETTLE_DELAY = 5
+
+# Lighter source variant (e.g. Frigate's `<camera>_sub` restream), registered in
+# go2rtc as its own stream. New viewers are pointed at it via the status payload's
+# "source" key once the viewer count or egress (kbit/s) limit is reached; 0 = unused.
+CONF_SUB_STREAM = "sub_stream"
+CONF_SUB_STREAM_VIEWERS = "sub_stream_viewers"
+CONF_SUB_STREAM_EGRESS = "sub_stream_egress"
+
+# Fraction of a limit the load must fall below before new viewers are sent back
+# to the main stream — avoids flapping around the threshold.
+SOURCE_HYSTERESIS = 0.8
+
+# Throttling of the externally reachable status / SSE views. Each (client, camera)
+# pair has a token bucket refilled at RATE_LIMIT_PER_SECOND up to RATE_LIMIT_BURST;
+# the client is the address forwarded by the Caddy sidecar in CLIENT_ADDRESS_HEADER.
+CLIENT_ADDRESS_HEADER = "X-SharedCam-Client"
+RATE_LIMIT_PER_SECOND = 0.5
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MAX_CLIENTS = 4096
+
+# Global cap on concurrently open SSE streams, and the Retry-After (seconds) sent
+# to clients turned away once it is reached.
+SSE_MAX_STREAMS = 500
+SSE_RETRY_AFTER = 30
+
+# HA bus events fired from the consumer-ID diff between polls.
+EVENT_VIEWER_JOINED = "sharedcam_viewer_joined"
+EVENT_VIEWER_LEFT = "sharedcam_viewer_left"
+
+# Viewer events are suppressed for a poll in which more viewers joined + left
+# than this (0 = never suppress) — e.g. a go2rtc restart dropping everyone.
+CONF_EVENT_BURST_LIMIT = "event_burst_limit"
+DEFAULT_EVENT_BURST_LIMIT = 10
+
+# Export mode: when set, the camera's status payload is written atomically to
+# <export_dir>/status/<camera>.json (served statically by the Caddy sidecar)
+# whenever it changes, at most once per EXPORT_DEBOUNCE seconds.
+CONF_EXPORT_DIR = "export_dir"
+EXPORT_DEBOUNCE = 1.0
+
+# Poster frames for GET /api/sharedcam/snapshot/{camera}: cached for SNAPSHOT_TTL
+# seconds within a total budget of SNAPSHOT_MAX_BYTES; larger frames than
+# SNAPSHOT_MAX_FRAME_BYTES are served but never cached. A grab taking longer than
+# SNAPSHOT_FETCH_TIMEOUT seconds fails every waiting request.
+SNAPSHOT_TTL = 10
+SNAPSHOT_MAX_BYTES = 8 * 1024 * 1024
+SNAPSHOT_MAX_FRAME_BYTES = 2 * 1024 * 1024
+SNAPSHOT_FETCH_TIMEOUT = 10
+
+# Viewer presence from the Caddy sidecar's JSON log: a file path, tailed every
+# PRESENCE_POLL_INTERVAL seconds, or tcp://<host>:<port> to listen on for
+# Caddy's `output net` writer. WebSocket opens and closes on /api/ws adjust the
+# viewer count between go2rtc polls; the next poll resets the adjustment.
+CONF_PRESENCE_LOG = "presence_log"
+PRESENCE_POLL_INTERVAL = 0.5
+PRESENCE_MAX_READ = 1024 * 1024
+# Open connections remembered for matching their close; oldest are forgotten first.
+PRESENCE_MAX_TRACKED = 10_000
+
+# Synthetic viewer probe: every CONF_PROBE_INTERVAL seconds (0 = off) open the
+# active source's /api/ws like the viewer page and time the connect, the MSE init
+# segment and the first media segment. The probe identifies itself with
+# PROBE_USER_AGENT so it is never counted as a viewer.
+CONF_PROBE_INTERVAL = "probe_interval"
+DEFAULT_PROBE_INTERVAL = 0
+PROBE_TIMEOUT = 15
+PROBE_USER_AGENT = "SharedCam-Probe"
+# Codecs offered in the MSE request — the list go2rtc's video-rtc.js sends from a
+# desktop browser.
+PROBE_CODECS = (
+    "avc1.640029,avc1.64002A,avc1.640033,hvc1.1.6.L153.B0,mp4a.40.2,mp4a.40.5,flac,opus"
+)
+
+# Admission control: with CONF_MAX_VIEWERS set (0 = unlimited) the status payload
+# reports free "slots", and viewer pages reserve one via POST
+# /api/sharedcam/admit/{camera} before connecting. A reservation holds its slot
+# until a poll fetched after it completes; ADMIT_RESERVATION_TTL (a poll interval
+# plus a margin for a slow poll) only bounds reservations when polls fail.
+# Turned-away pages retry after ADMIT_RETRY_AFTER.
+CONF_MAX_VIEWERS = "max_viewers"
+ADMIT_RESERVATION_TTL = int(SCAN_INTERVAL.total_seconds()) + 15
+ADMIT_RETRY_AFTER = 10
@@ -1,39 +1,106 @@
 """DataUpdateCoordinator for SharedCam."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .admission import SharedCamAdmission
 from .const import (
     CONF_CAMERA_NAME,
+    CONF_EVENT_BURST_LIMIT,
     CONF_FRIGATE_URL,
     CONF_GO2RTC_URL,
+    CONF_RETIRED_STREAMS,
+    CONF_STREAM_ENABLED,
+    CONF_SUB_STREAM,
+    CONF_SUB_STREAM_EGRESS,
+    CONF_SUB_STREAM_VIEWERS,
+    DEFAULT_EVENT_BURST_LIMIT,
     DOMAIN,
+    EVENT_VIEWER_JOINED,
+    EVENT_VIEWER_LEFT,
+    PROBE_USER_AGENT,
+    RECONCILE_BACKOFF_MAX,
+    RECONCILE_BACKOFF_MIN,
     SCAN_INTERVAL,
+    SOURCE_HYSTERESIS,
+    STALL_POLLS,
 )
+from .media import extract_media, media_fingerprint
+from .reconciler import async_get_reconciler
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _is_probe(consumer) -> bool:
+    """Return True for the consumer opened by SharedCam's own latency probe."""
+    return isinstance(consumer, dict) and str(
+        consumer.get("user_agent") or ""
+    ).startswith(PROBE_USER_AGENT)
+
+
 def _consumer_count(stream_data) -> int:
     """Return active viewer count from stream data.
 
     go2rtc returns "consumers": null (not absent) when no viewers are connected,
     so we must guard against None from both the key being absent and being null.
+    The latency probe's connection is not a viewer and is left out.
     """
     if stream_data is None:
         return 0
     if isinstance(stream_data, dict):
-        return len(stream_data.get("consumers") or [])
+        return sum(
+            1 for consumer in stream_data.get("consumers") or [] if not _is_probe(consumer)
+        )
     return len(getattr(stream_data, "consumers", None) or [])
 
 
+def _connections(stream_data, key: str) -> list[dict]:
+    """Return the raw producer or consumer dicts ("producers" / "consumers") of a stream."""
+    if not isinstance(stream_data, dict):
+        return []
+    return [conn for conn in stream_data.get(key) or [] if isinstance(conn, dict)]
+
+
+def _consumer_id(consumer: dict):
+    """Return a key identifying a consumer across polls.
+
+    go2rtc numbers every connection with a process-wide "id"; older releases omit
+    it, in which case the remote address is the best stable identity available.
+    """
+    return consumer.get("id") or consumer.get("remote_addr")
+
+
+def _session_details(consumer: dict) -> dict:
+    """Return the identifying details of a consumer carried in viewer events."""
+    return {
+        "remote_addr": consumer.get("remote_addr"),
+        "user_agent": consumer.get("user_agent"),
+    }
+
+
+# Surfaced fields the status payload (SSE, export) is built from.
+STATUS_FIELDS = frozenset(
+    {"available", "enabled", "viewers", "source", "media", "slots", "stalled"}
+)
+
+
+def _counter_delta(new: int, old: int) -> int:
+    """Return the increase of a byte counter, treating a decrease as a reset."""
+    return new - old if new >= old else new
+
+
 class SharedCamCoordinator(DataUpdateCoordinator):
     """Coordinator that polls go2rtc /api/streams for one camera every 30 s."""
 
@@ -52,6 +119,208 @@ class SharedCamCoordinator(DataUpdateCoordinator):
             f"{config_entry.data[CONF_FRIGATE_URL]}/{self.camera_name}"
         )
         self._client = None
+        # Serialises enable/disable calls so the reconciler never races the switch.
+        self._stream_lock = asyncio.Lock()
+        self.reconciler = async_get_reconciler(hass, self.go2rtc_url)
+        # Number of drifted streams the reconciler has repaired for this camera.
+        self.repairs = 0
+        # Throughput in bits/s derived from go2rtc byte counters; None until two
+        # polls are available to diff.
+        self.throughput: dict[str, float | None] = {
+            "egress": None,
+            "ingest": None,
+            "per_viewer": None,
+        }
+        self._last_poll: float | None = None
+        self._consumer_sent: dict = {}
+        self._producer_recv = 0
+        # go2rtc stream name new viewers should connect to — the camera itself or
+        # its lighter sub-stream variant once viewer load crosses the limits.
+        self.active_source: str = self.camera_name
+        self._main_viewer_bps: float | None = None
+        # Consumer ID → (monotonic time first seen, event details); None until the
+        # first poll, which only establishes the baseline (viewers already watching
+        # did not just join).
+        self._sessions: dict | None = None
+        # Surfaced state as of the last listener fan-out, and the fields that
+        # differed from the one before it; see async_update_listeners().
+        self._surfaced: dict | None = None
+        self.changed_fields: frozenset[str] = frozenset()
+        # WebSocket opens minus closes reported by the presence log since the
+        # last poll; see async_presence_changed().
+        self._presence_delta = 0
+        # Latest synthetic probe timings in ms (see probe.py); None while the
+        # probe is off or after it failed, with the failure in probe_error.
+        self.latency: dict[str, float | None] = {
+            "connect": None,
+            "init": None,
+            "first_frame": None,
+        }
+        self.probe_error: str | None = None
+        # go2rtc stream name → (producer fingerprint, media description); kept
+        # while nobody watches and go2rtc has disconnected the producer.
+        self._media: dict[str, tuple[tuple, dict | None]] = {}
+        self.admission = SharedCamAdmission(hass, self)
+        # go2rtc stream name → (producer received bytes, polls since they last
+        # moved), tracked while the stream has consumers; see _update_stalls().
+        self._stall_recv: dict[str, tuple[int, int]] = {}
+        # Streams currently stalled, stalls detected, and stall re-registrations.
+        self.stalled: set[str] = set()
+        self.stalls = 0
+        self.stall_recoveries = 0
+        self._stall_attempts: dict[str, int] = {}
+        self._stall_retry_at: dict[str, float] = {}
+        # Run when the config entry unloads, e.g. to end websocket subscriptions
+        # that would otherwise stay attached to this coordinator after a reload.
+        self._close_listeners: list[Callable[[], None]] = []
+
+    @property
+    def stream_desired(self) -> bool:
+        """Return True when the user has enabled this stream (persisted in options)."""
+        return bool(self.config_entry.options.get(CONF_STREAM_ENABLED))
+
+    @property
+    def stream_busy(self) -> bool:
+        """Return True while an enable/disable request is in flight."""
+        return self._stream_lock.locked()
+
+    @property
+    def sub_stream(self) -> str | None:
+        """Return the go2rtc name of the lighter source variant, if configured."""
+        return (self.config_entry.options.get(CONF_SUB_STREAM) or "").strip() or None
+
+    @property
+    def stream_sources(self) -> dict[str, str]:
+        """Return every go2rtc stream this camera registers, name → RTSP source URL.
+
+        The sub-stream variant (e.g. Frigate's `<camera>_sub` restream) is a
+        separate go2rtc stream; go2rtc only pulls it once a viewer connects.
+        """
+        sources = {self.camera_name: self.rtsp_url}
+        if (sub := self.sub_stream) and sub != self.camera_name:
+            sources[sub] = f"{self.config_entry.data[CONF_FRIGATE_URL]}/{sub}"
+        return sources
+
+    @property
+    def retired_sources(self) -> list[str]:
+        """Return variants dropped from this camera's options that go2rtc may still have."""
+        return [
+            name
+            for name in self.config_entry.options.get(CONF_RETIRED_STREAMS) or ()
+            if name not in self.stream_sources
+        ]
+
+    @callback
+    def async_forget_retired(self, names: set[str]) -> None:
+        """Drop variants that are gone from go2rtc from the persisted retired list."""
+        options = dict(self.config_entry.options)
+        remaining = [
+            name for name in options.pop(CONF_RETIRED_STREAMS, None) or () if name not in names
+        ]
+        if remaining:
+            options[CONF_RETIRED_STREAMS] = remaining
+        self.hass.config_entries.async_update_entry(self.config_entry, options=options)
+
+    def stream_data_from(self, raw: dict) -> dict | None:
+        """Return this camera's entry from a raw /api/streams response.
+
+        When the sub-stream variant is registered too, its producers and consumers
+        are merged in so viewer counts and throughput cover both variants.
+        """
+        main = raw.get(self.camera_name)
+        if main is None:
+            return None
+        sub = raw.get(self.sub_stream) if self.sub_stream in self.stream_sources else None
+        if not isinstance(sub, dict) or not isinstance(main, dict):
+            return main
+        return {
+            **main,
+            "producers": _connections(main, "producers") + _connections(sub, "producers"),
+            "consumers": _connections(main, "consumers") + _connections(sub, "consumers"),
+        }
+
+    @property
+    def viewer_count(self) -> int:
+        """Return the polled consumer count adjusted by presence-log events since."""
+        if self.data is None:
+            return 0
+        return max(0, _consumer_count(self.data) + self._presence_delta)
+
+    @property
+    def media(self) -> dict | None:
+        """Return codec, profile and frame size of the active source, if known."""
+        cached = self._media.get(self.active_source)
+        return cached[1] if cached else None
+
+    @callback
+    def async_presence_changed(self, delta: int) -> None:
+        """Apply viewer WebSocket opens (+) and closes (-) seen since the last poll.
+
+        go2rtc stays the source of truth: the next poll counts these viewers
+        itself and discards the adjustment.
+        """
+        if self.data is None:
+            return
+        self._presence_delta += delta
+        self.async_update_listeners()
+
+    @callback
+    def async_on_close(self, action: Callable[[], None]) -> Callable[[], None]:
+        """Call `action` when the config entry unloads; returns a callback that cancels it."""
+        self._close_listeners.append(action)
+
+        @callback
+        def _remove() -> None:
+            if action in self._close_listeners:
+                self._close_listeners.remove(action)
+
+        return _remove
+
+    @callback
+    def async_close(self) -> None:
+        """Run the close callbacks; a reload replaces this coordinator with a new one."""
+        listeners, self._close_listeners = self._close_listeners, []
+        for action in listeners:
+            action()
+
+    def _surfaced_state(self) -> dict:
+        """Return every value the entities and the status payload are derived from."""
+        return {
+            "available": self.last_update_success,
+            "enabled": self.data is not None,
+            "viewers": self.viewer_count,
+            "source": self.active_source,
+            "media": self.media,
+            "slots": self.admission.slots,
+            "stalled": bool(self.stalled),
+            "stalls": self.stalls,
+            "stall_recoveries": self.stall_recoveries,
+            **self.throughput,
+            "repairs": self.repairs,
+            "restarts": self.reconciler.restarts,
+            **{f"latency_{key}": value for key, value in self.latency.items()},
+            "probe_error": self.probe_error,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners only when a surfaced field changed since the last fan-out.
+
+        Most 30 s polls change nothing anyone can see — the byte counters move but
+        the stream state, viewer count and source stay put. Listeners read
+        `changed_fields` to skip work for fields they do not display.
+        """
+        state = self._surfaced_state()
+        previous = self._surfaced
+        self._surfaced = state
+        self.changed_fields = frozenset(
+            key
+            for key, value in state.items()
+            if previous is None or previous.get(key) != value
+        )
+        if not self.changed_fields:
+            return
+        super().async_update_listeners()
 
     def _get_client(self):
         """Return (and lazily create) the go2rtc REST client."""
@@ -70,25 +339,310 @@ class SharedCamCoordinator(DataUpdateCoordinator):
         returned — the typed Stream model omits the consumers[] array that we need
         for the viewer count.
         """
+        fetched = time.monotonic()
         try:
             client = self._get_client()
             resp = await client._client.request("GET", "/api/streams")  # noqa: SLF001
             raw: dict = await resp.json()
         except Exception as err:
             raise UpdateFailed(f"Error fetching go2rtc streams: {err}") from err  # noqa: TRY003
+        self._presence_delta = 0
+
+        # Repair drift against entry.options for every camera on this host —
+        # this also covers re-registering streams after HA or go2rtc restarts.
+        await self.reconciler.async_reconcile(raw, self)
 
         # Returns the per-camera dict {"producers": [...], "consumers": [...]}
         # or None when the stream is not registered.
-        return raw.get(self.camera_name)
+        data = self.stream_data_from(raw)
+        self._update_throughput(data)
+        self._update_sessions(data)
+        self._update_active_source(data, raw)
+        self._update_media(raw)
+        due = self._update_stalls(raw)
+        if due and self.stream_desired and not self.stream_busy:
+            await self._async_recover_stalls(due)
+        # This poll counts every viewer admitted before it fetched.
+        self.admission.async_poll_completed(fetched)
+        return data
+
+    def _update_throughput(self, stream_data) -> None:
+        """Diff go2rtc byte counters against the previous poll.
+
+        Consumers are matched by ID with a set-based diff: viewers present in both
+        polls contribute their counter delta, new viewers their whole counter (all
+        of it was sent since the last poll), and departed viewers drop out. The
+        latency probe's traffic is not viewer egress and is left out.
+        """
+        now = time.monotonic()
+        sent = {
+            _consumer_id(consumer): int(consumer.get("bytes_send") or 0)
+            for consumer in _connections(stream_data, "consumers")
+            if not _is_probe(consumer)
+        }
+        recv = sum(
+            int(producer.get("bytes_recv") or 0)
+            for producer in _connections(stream_data, "producers")
+        )
+
+        if stream_data is None:
+            self.throughput = {"egress": 0.0, "ingest": 0.0, "per_viewer": 0.0}
+        elif self._last_poll is not None and (elapsed := now - self._last_poll) > 0:
+            previous = self._consumer_sent
+            stayed = sent.keys() & previous.keys()
+            joined = sent.keys() - previous.keys()
+            sent_bytes = sum(
+                _counter_delta(sent[cid], previous[cid]) for cid in stayed
+            ) + sum(sent[cid] for cid in joined)
+            egress = sent_bytes * 8 / elapsed
+            self.throughput = {
+                "egress": egress,
+                "ingest": _counter_delta(recv, self._producer_recv) * 8 / elapsed,
+                "per_viewer": egress / len(sent) if sent else 0.0,
+            }
+
+        self._last_poll = now
+        self._consumer_sent = sent
+        self._producer_recv = recv
+
+    def _update_sessions(self, stream_data) -> None:
+        """Fire viewer joined/left events from the consumer-ID diff against the last poll.
+
+        Events carry remote address, user agent and (on leave) the session duration,
+        which is accurate to one poll interval. When more viewers change in a single
+        poll than the camera's burst limit allows (0 = no limit) — e.g. after a
+        go2rtc restart — the individual events are suppressed.
+        """
+        now = time.monotonic()
+        consumers = {
+            _consumer_id(consumer): consumer
+            for consumer in _connections(stream_data, "consumers")
+            if not _is_probe(consumer)
+        }
+        sessions = self._sessions
+        if sessions is None:
+            self._sessions = {
+                cid: (now, _session_details(consumer))
+                for cid, consumer in consumers.items()
+            }
+            return
+
+        joined = consumers.keys() - sessions.keys()
+        left = sessions.keys() - consumers.keys()
+        if not joined and not left:
+            return
+
+        limit = int(
+            self.config_entry.options.get(
+                CONF_EVENT_BURST_LIMIT, DEFAULT_EVENT_BURST_LIMIT
+            )
+        )
+        fire = not limit or len(joined) + len(left) <= limit
+        if not fire:
+            _LOGGER.debug(
+                "Suppressing viewer events for '%s': %d joined, %d left in one poll",
+                self.camera_name,
+                len(joined),
+                len(left),
+            )
+
+        for cid in left:
+            started, details = sessions.pop(cid)
+            if fire:
+                self.hass.bus.async_fire(
+                    EVENT_VIEWER_LEFT,
+                    {
+                        "camera": self.camera_name,
+                        "consumer_id": cid,
+                        **details,
+                        "duration": round(now - started),
+                    },
+                )
+        for cid in joined:
+            details = _session_details(consumers[cid])
+            sessions[cid] = (now, details)
+            if fire:
+                self.hass.bus.async_fire(
+                    EVENT_VIEWER_JOINED,
+                    {"camera": self.camera_name, "consumer_id": cid, **details},
+                )
+
+    def _update_active_source(self, stream_data, raw: dict) -> None:
+        """Pick the variant new viewers should use from viewer count and egress.
+
+        Switches to the sub stream when either configured limit (0 = unused) is
+        reached. Egress drops after the switch, so the way back compares the
+        egress the main stream *would* carry — viewers times the per-viewer bitrate
+        measured on main — against the limits scaled by SOURCE_HYSTERESIS.
+        """
+        sub = self.sub_stream
+        if stream_data is None or sub not in self.stream_sources or sub not in raw:
+            self.active_source = self.camera_name
+            return
+
+        options = self.config_entry.options
+        viewer_limit = int(options.get(CONF_SUB_STREAM_VIEWERS) or 0)
+        egress_limit = float(options.get(CONF_SUB_STREAM_EGRESS) or 0) * 1000
+        viewers = _consumer_count(stream_data)
+
+        if self.active_source == self.camera_name:
+            egress = self.throughput["egress"] or 0.0
+            if (viewer_limit and viewers >= viewer_limit) or (
+                egress_limit and egress >= egress_limit
+            ):
+                self._main_viewer_bps = self.throughput["per_viewer"]
+                self.active_source = sub
+                _LOGGER.info(
+                    "Switching new viewers of '%s' to lighter source '%s' "
+                    "(%d viewers, %.0f kbit/s egress)",
+                    self.camera_name,
+                    sub,
+                    viewers,
+                    egress / 1000,
+                )
+            return
+
+        projected = viewers * (self._main_viewer_bps or 0.0)
+        if (not viewer_limit or viewers < viewer_limit * SOURCE_HYSTERESIS) and (
+            not egress_limit or projected < egress_limit * SOURCE_HYSTERESIS
+        ):
+            self.active_source = self.camera_name
+            _LOGGER.info(
+                "Switching new viewers of '%s' back to the main source", self.camera_name
+            )
+
+    def _update_media(self, raw: dict) -> None:
+        """Re-derive each source's media description when its producers change.
+
+        Parsing SDP and SPS happens only when the producers' descriptions differ
+        from the previous poll; a source whose producer is idle keeps the last
+        description.
+        """
+        for name in self.stream_sources:
+            producers = _connections(raw.get(name), "producers")
+            fingerprint = media_fingerprint(producers)
+            cached = self._media.get(name)
+            if cached is not None and cached[0] == fingerprint:
+                continue
+            if (media := extract_media(producers)) is None and cached is not None:
+                media = cached[1]
+            self._media[name] = (fingerprint, media)
+
+    def _update_stalls(self, raw: dict) -> list[str]:
+        """Flag streams whose producer stopped receiving while consumers are attached.
+
+        go2rtc keeps listing a stream whose RTSP source hung, consumers and all,
+        so only the producer's received-byte counter shows that nothing flows.
+        Returns the stalled streams due for a recovery attempt.
+        """
+        for name in self.stream_sources:
+            stream = raw.get(name)
+            producers = _connections(stream, "producers")
+            viewers = [
+                consumer
+                for consumer in _connections(stream, "consumers")
+                if not _is_probe(consumer)
+            ]
+            if not producers or not viewers:
+                # go2rtc only pulls the source while someone watches; a probe
+                # alone is too short-lived to judge the source by.
+                self._stall_recv.pop(name, None)
+                self.stalled.discard(name)
+                continue
+
+            recv = sum(int(producer.get("bytes_recv") or 0) for producer in producers)
+            previous = self._stall_recv.get(name)
+            idle = previous[1] + 1 if previous is not None and previous[0] == recv else 0
+            self._stall_recv[name] = (recv, idle)
+            if idle == 0:
+                self.stalled.discard(name)
+                if previous is not None:
+                    # Bytes are flowing again; the next stall starts a fresh backoff.
+                    self._stall_attempts.pop(name, None)
+                    self._stall_retry_at.pop(name, None)
+            elif idle >= STALL_POLLS and name not in self.stalled:
+                self.stalled.add(name)
+                self.stalls += 1
+                _LOGGER.warning(
+                    "go2rtc stream '%s' stalled — no bytes from its source for %d polls "
+                    "with viewers attached",
+                    name,
+                    idle,
+                )
+
+        now = time.monotonic()
+        return [
+            name
+            for name in sorted(self.stalled)
+            if self._stall_retry_at.get(name, 0.0) <= now
+        ]
+
+    async def _async_recover_stalls(self, names: list[str]) -> None:
+        """Re-register stalled streams so go2rtc reconnects to their source.
+
+        Only the stalled stream is replaced (PUT /api/streams); a restart would
+        drop every other stream on the host. Attempts back off while the stream
+        stays stalled.
+        """
+        for name in names:
+            attempts = self._stall_attempts.get(name, 0) + 1
+            self._stall_attempts[name] = attempts
+            delay = min(RECONCILE_BACKOFF_MIN * 2 ** (attempts - 1), RECONCILE_BACKOFF_MAX)
+            self._stall_retry_at[name] = time.monotonic() + delay
+            try:
+                await self.async_enable_stream(name)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning(
+                    "Failed to re-register stalled go2rtc stream '%s' "
+                    "(attempt %d, next try in %ds): %s",
+                    name,
+                    attempts,
+                    delay,
+                    err,
+                )
+                continue
+            self.stall_recoveries += 1
+            _LOGGER.info(
+                "Re-registered stalled go2rtc stream '%s' (attempt %d)", name, attempts
+            )
 
     # ------------------------------------------------------------------
     # Stream management helpers (called by the switch entity)
     # ------------------------------------------------------------------
 
-    async def async_enable_stream(self) -> None:
-        """Register the stream in go2rtc (PUT /api/streams)."""
-        await self._get_client().streams.add(self.camera_name, self.rtsp_url)
-        _LOGGER.debug("Enabled go2rtc stream '%s' → %s", self.camera_name, self.rtsp_url)
+    async def async_enable_stream(self, name: str | None = None) -> None:
+        """Register the stream and its variants in go2rtc (PUT /api/streams).
+
+        `name` limits registration to a single stream — the reconciler uses it so
+        a missing variant is re-added without replacing a healthy main stream.
+        """
+        sources = self.stream_sources
+        if name is not None:
+            sources = {name: sources[name]}
+        async with self._stream_lock:
+            for stream_name, rtsp_url in sources.items():
+                await self._get_client().streams.add(stream_name, rtsp_url)
+                _LOGGER.debug("Enabled go2rtc stream '%s' → %s", stream_name, rtsp_url)
+
+    async def async_remove_stream(self, name: str | None = None) -> None:
+        """Deregister streams without restarting go2rtc (DELETE /api/streams).
+
+        Used by the reconciler for streams that are present but disabled in HA;
+        a restart here would drop every other stream on the host.
+        """
+        names = list(self.stream_sources) if name is None else [name]
+        async with self._stream_lock:
+            for stream_name in names:
+                await self._get_client()._client.request(  # noqa: SLF001
+                    "DELETE", "/api/streams", params={"src": stream_name}
+                )
+
+    async def async_fetch_frame(self) -> bytes:
+        """Grab a JPEG frame of the active source from go2rtc (GET /api/frame.jpeg)."""
+        resp = await self._get_client()._client.request(  # noqa: SLF001
+            "GET", "/api/frame.jpeg", params={"src": self.active_source}
+        )
+        return await resp.read()
 
     async def async_disable_stream(self) -> None:
         """Deregister the stream and restart go2rtc (DELETE + POST /api/restart).
@@ -100,9 +654,15 @@ class SharedCamCoordinator(DataUpdateCoordinator):
         so we call the underlying _BaseClient.request() directly.
         """
         client = self._get_client()
-        # go2rtc DELETE uses ?src=<stream_name> (not the RTSP URL, despite the param name)
-        await client._client.request(  # noqa: SLF001
-            "DELETE", "/api/streams", params={"src": self.camera_name}
-        )
-        await client._client.request("POST", "/api/restart")  # noqa: SLF001
+        async with self._stream_lock:
+            # go2rtc DELETE uses ?src=<stream_name> (not the RTSP URL, despite the param name)
+            for stream_name in [*self.stream_sources, *self.retired_sources]:
+                await client._client.request(  # noqa: SLF001
+                    "DELETE", "/api/streams", params={"src": stream_name}
+                )
+            await client._client.request("POST", "/api/restart")  # noqa: SLF001
         _LOGGER.debug("Disabled go2rtc stream '%s'", self.camera_name)
+
+        # The restart dropped every other stream on this host — repair them now
+        # rather than waiting up to a full poll interval.
+        self.reconciler.async_request_check(self)
@@ -0,0 +1,24 @@
+"""Base entity for SharedCam."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import SharedCamCoordinator
+
+
+class SharedCamEntity(CoordinatorEntity[SharedCamCoordinator]):
+    """Coordinator entity that only writes state when a field it shows changed.
+
+    Subclasses list the surfaced coordinator fields their state and attributes
+    are derived from in `_watched_fields`; availability is always watched.
+    """
+
+    _watched_fields: frozenset[str] = frozenset()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if the update touched one of this entity's fields."""
+        changed = self.coordinator.changed_fields
+        if "available" in changed or changed & self._watched_fields:
+            super()._handle_coordinator_update()
@@ -0,0 +1,108 @@
+"""Static status export — write each camera's status payload to a file Caddy serves.
+
+In export mode viewer pages fetch `status/<camera>.json` from the Caddy sidecar
+instead of reaching HA through the `/status*` proxy, so a public share costs HA
+one file write per change no matter how many people are watching.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import EXPORT_DEBOUNCE
+from .status import _build_status_payload, _unavailable_payload, async_track_status
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """Write `content` to `path` via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(content)
+    tmp.replace(path)
+
+
+class SharedCamStatusExporter:
+    """Keeps `<export_dir>/status/<camera>.json` in sync with the status payload."""
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: SharedCamCoordinator, export_dir: str
+    ) -> None:
+        """Initialise the exporter."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.path = Path(export_dir) / "status" / f"{coordinator.camera_name}.json"
+        self._last_written: bytes | None = None
+        self._unsub_debounce: Callable[[], None] | None = None
+        # Writes share one temp file, so they run one at a time and in order.
+        self._write_lock = asyncio.Lock()
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Start exporting on every payload change; returns a callback that stops it."""
+        unsub_status = async_track_status(
+            self.hass, self.coordinator, self._async_schedule
+        )
+
+        # Write the current state straight away so the file exists for new viewers.
+        self._async_schedule()
+
+        @callback
+        def _stop() -> None:
+            unsub_status()
+            if self._unsub_debounce is not None:
+                self._unsub_debounce()
+                self._unsub_debounce = None
+            # Leave viewers of the static file an offline status, not the last
+            # live one.
+            self.hass.async_create_task(self._async_write_payload(_unavailable_payload()))
+
+        return _stop
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Coalesce bursts of changes into one write EXPORT_DEBOUNCE seconds later."""
+        if self._unsub_debounce is None:
+            self._unsub_debounce = async_call_later(
+                self.hass, EXPORT_DEBOUNCE, self._async_write
+            )
+
+    async def _async_write(self, _now) -> None:
+        """Write the current payload."""
+        self._unsub_debounce = None
+        await self._async_write_payload()
+
+    async def _async_write_payload(self, payload: dict | None = None) -> None:
+        """Write `payload` (default: the current one) if it differs from the last file written.
+
+        A change during a slow write queues behind it and renders the payload
+        only once the lock is free, so the newest state always lands last.
+        """
+        async with self._write_lock:
+            if payload is None:
+                payload = _build_status_payload(self.hass, self.coordinator)
+            content = json.dumps(payload, ensure_ascii=False, sort_keys=True).encode()
+            if content == self._last_written:
+                return
+
+            try:
+                await self.hass.async_add_executor_job(_write_atomic, self.path, content)
+            except OSError as err:
+                _LOGGER.warning("Failed to export status to %s: %s", self.path, err)
+                return
+            self._last_written = content
+        _LOGGER.debug("Exported status for '%s' to %s", self.coordinator.camera_name, self.path)
@@ -0,0 +1,279 @@
+"""Media description of a go2rtc source, derived from its producer entries.
+
+go2rtc lists what a producer delivers in `/api/streams`: the RTSP producer's
+"sdp" carries the codecs and, for H.264, the profile-level-id and SPS, while
+"medias" summarises each track as e.g. "video, recvonly, H264". From these the
+viewer page learns the codec, profile, MSE codec string and frame size before
+it opens the WebSocket, so it can pick the player's codec list and layout up
+front instead of negotiating blind.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+
+# RTP encoding names (SDP rtpmap / go2rtc medias) → codec names in the payload.
+_CODEC_NAMES = {
+    "H264": "h264",
+    "H265": "h265",
+    "MPEG4-GENERIC": "aac",
+    "MP4A-LATM": "aac",
+    "OPUS": "opus",
+    "PCMA": "pcma",
+    "PCMU": "pcmu",
+    "JPEG": "mjpeg",
+}
+
+# H.264 profile_idc → profile name.
+_H264_PROFILES = {
+    66: "Baseline",
+    77: "Main",
+    88: "Extended",
+    100: "High",
+    110: "High 10",
+    122: "High 4:2:2",
+    244: "High 4:4:4",
+}
+
+# profile_idc values whose SPS carries chroma format and scaling matrices.
+_H264_HIGH_PROFILES = frozenset({100, 110, 122, 244, 44, 83, 86, 118, 128, 138, 139, 134, 135})
+
+# chroma_format_idc of 4:4:4 video, whose SPS adds a colour plane flag and
+# six more scaling lists.
+_CHROMA_444 = 3
+# The first six scaling lists are 4x4 (16 coefficients), the rest 8x8 (64).
+_SCALING_LISTS_4X4 = 6
+# Longest Exp-Golomb prefix that fits a 32-bit field.
+_MAX_GOLOMB_ZEROS = 31
+# profile-level-id is three hex-encoded bytes.
+_PROFILE_LEVEL_ID_LEN = 6
+# go2rtc "medias" summaries read "<kind>, <direction>, <codec>[/<clock>], ...".
+_MEDIAS_CODEC_FIELD = 2
+
+# MSE codec strings for audio codecs the viewer page can play.
+_AUDIO_MIME = {"aac": "mp4a.40.2", "opus": "opus"}
+
+
+class _BitReader:
+    """Reads fixed-width and Exp-Golomb fields from an RBSP."""
+
+    def __init__(self, data: bytes) -> None:
+        self._value = int.from_bytes(data, "big")
+        self._left = len(data) * 8
+
+    def u(self, bits: int) -> int:
+        """Read an unsigned `bits`-wide field."""
+        if bits > self._left:
+            raise ValueError("SPS truncated")  # noqa: TRY003
+        self._left -= bits
+        return (self._value >> self._left) & ((1 << bits) - 1)
+
+    def ue(self) -> int:
+        """Read an unsigned Exp-Golomb field."""
+        zeros = 0
+        while not self.u(1):
+            zeros += 1
+            if zeros > _MAX_GOLOMB_ZEROS:
+                raise ValueError("Invalid Exp-Golomb code")  # noqa: TRY003
+        return (1 << zeros) - 1 + self.u(zeros)
+
+    def se(self) -> int:
+        """Read a signed Exp-Golomb field."""
+        code = self.ue()
+        return (code + 1) // 2 if code % 2 else -(code // 2)
+
+
+def _skip_scaling_list(reader: _BitReader, size: int) -> None:
+    last = next_scale = 8
+    for _ in range(size):
+        if next_scale:
+            next_scale = (last + reader.se()) % 256
+        last = next_scale or last
+
+
+def _read_chroma_format(reader: _BitReader) -> int:
+    """Read the High profile fields of an SPS; return its chroma_format_idc."""
+    chroma_format_idc = reader.ue()
+    if chroma_format_idc == _CHROMA_444:
+        reader.u(1)  # separate_colour_plane_flag
+    reader.ue()  # bit_depth_luma_minus8
+    reader.ue()  # bit_depth_chroma_minus8
+    reader.u(1)  # qpprime_y_zero_transform_bypass_flag
+    if reader.u(1):  # seq_scaling_matrix_present_flag
+        for i in range(12 if chroma_format_idc == _CHROMA_444 else 8):
+            if reader.u(1):
+                _skip_scaling_list(reader, 16 if i < _SCALING_LISTS_4X4 else 64)
+    return chroma_format_idc
+
+
+def h264_sps_info(sps: bytes) -> dict:
+    """Return profile_idc, constraint flags, level_idc and frame size from an H.264 SPS NAL unit.
+
+    Raises ValueError for a truncated or malformed SPS.
+    """
+    # Drop emulation prevention bytes (00 00 03 → 00 00) to get the RBSP.
+    rbsp = sps[1:].replace(b"\x00\x00\x03", b"\x00\x00")
+    reader = _BitReader(rbsp)
+    profile_idc = reader.u(8)
+    constraint_flags = reader.u(8)
+    level_idc = reader.u(8)
+    reader.ue()  # seq_parameter_set_id
+
+    chroma_format_idc = 1
+    if profile_idc in _H264_HIGH_PROFILES:
+        chroma_format_idc = _read_chroma_format(reader)
+
+    reader.ue()  # log2_max_frame_num_minus4
+    poc_type = reader.ue()
+    if poc_type == 0:
+        reader.ue()  # log2_max_pic_order_cnt_lsb_minus4
+    elif poc_type == 1:
+        reader.u(1)  # delta_pic_order_always_zero_flag
+        reader.se()  # offset_for_non_ref_pic
+        reader.se()  # offset_for_top_to_bottom_field
+        for _ in range(reader.ue()):
+            reader.se()
+    reader.ue()  # max_num_ref_frames
+    reader.u(1)  # gaps_in_frame_num_value_allowed_flag
+
+    width_mbs = reader.ue() + 1
+    height_map_units = reader.ue() + 1
+    frame_mbs_only = reader.u(1)
+    if not frame_mbs_only:
+        reader.u(1)  # mb_adaptive_frame_field_flag
+    reader.u(1)  # direct_8x8_inference_flag
+
+    width = width_mbs * 16
+    height = (2 - frame_mbs_only) * height_map_units * 16
+    if reader.u(1):  # frame_cropping_flag
+        left, right, top, bottom = (reader.ue() for _ in range(4))
+        crop_x = 2 if chroma_format_idc in (1, 2) else 1
+        crop_y = (2 if chroma_format_idc == 1 else 1) * (2 - frame_mbs_only)
+        width -= (left + right) * crop_x
+        height -= (top + bottom) * crop_y
+
+    return {
+        "profile_idc": profile_idc,
+        "constraint_flags": constraint_flags,
+        "level_idc": level_idc,
+        "width": width,
+        "height": height,
+    }
+
+
+def _sdp_tracks(sdp: str) -> dict[str, tuple[str, dict[str, str]]]:
+    """Return {"video"/"audio": (encoding name, fmtp parameters)} for the first track of each kind."""
+    tracks: dict[str, tuple[str, dict[str, str]]] = {}
+    kind: str | None = None
+    encodings: dict[str, str] = {}
+    fmtps: dict[str, dict[str, str]] = {}
+    payload_types: list[str] = []
+
+    def _close() -> None:
+        if kind in ("video", "audio") and kind not in tracks:
+            for pt in payload_types:
+                if pt in encodings:
+                    tracks[kind] = (encodings[pt], fmtps.get(pt, {}))
+                    break
+
+    for raw_line in sdp.splitlines():
+        line = raw_line.strip()
+        if line.startswith("m="):
+            _close()
+            fields = line[2:].split()
+            kind = fields[0] if fields else None
+            payload_types = fields[3:]
+            encodings, fmtps = {}, {}
+        elif line.startswith("a=rtpmap:"):
+            pt, _, rest = line[9:].partition(" ")
+            encodings[pt] = rest.split("/")[0].upper()
+        elif line.startswith("a=fmtp:"):
+            pt, _, rest = line[7:].partition(" ")
+            fmtps[pt] = {
+                key.strip().lower(): value.strip()
+                for key, sep, value in (
+                    param.partition("=") for param in rest.split(";")
+                )
+                if sep
+            }
+    _close()
+    return tracks
+
+
+def _medias_codecs(medias: list) -> dict[str, str]:
+    """Return {"video"/"audio": encoding name} from go2rtc "medias" summaries."""
+    codecs: dict[str, str] = {}
+    for media in medias:
+        if not isinstance(media, str):
+            continue
+        parts = [part.strip() for part in media.split(",")]
+        if len(parts) > _MEDIAS_CODEC_FIELD and parts[0] in ("video", "audio"):
+            codecs.setdefault(parts[0], parts[_MEDIAS_CODEC_FIELD].split("/")[0].upper())
+    return codecs
+
+
+def _h264_details(fmtp: dict[str, str]) -> dict:
+    """Return profile, MSE codec string and frame size from H.264 fmtp parameters."""
+    details: dict = {}
+    sps_info: dict | None = None
+    sprop = fmtp.get("sprop-parameter-sets", "").split(",")[0]
+    if sprop:
+        try:
+            sps_info = h264_sps_info(base64.b64decode(sprop + "=" * (-len(sprop) % 4)))
+        except (ValueError, binascii.Error):
+            sps_info = None
+
+    profile_level_id = fmtp.get("profile-level-id", "")
+    try:
+        profile_idc = (
+            int(profile_level_id, 16) >> 16
+            if len(profile_level_id) == _PROFILE_LEVEL_ID_LEN
+            else None
+        )
+    except ValueError:
+        profile_idc = None
+    if profile_idc is not None:
+        details["mime"] = f"avc1.{profile_level_id.upper()}"
+        details["profile"] = _H264_PROFILES.get(profile_idc)
+    if sps_info is not None:
+        if "mime" not in details:
+            details["mime"] = "avc1.{profile_idc:02X}{constraint_flags:02X}{level_idc:02X}".format(
+                **sps_info
+            )
+            details["profile"] = _H264_PROFILES.get(sps_info["profile_idc"])
+        details["width"] = sps_info["width"]
+        details["height"] = sps_info["height"]
+    return {key: value for key, value in details.items() if value is not None}
+
+
+def media_fingerprint(producers: list[dict]) -> tuple:
+    """Return what extract_media() reads from the producers, for change detection."""
+    return tuple(
+        (producer.get("sdp") or "", tuple(producer.get("medias") or ()))
+        for producer in producers
+    )
+
+
+def extract_media(producers: list[dict]) -> dict | None:
+    """Describe the first producer that reports its media; None if none does yet.
+
+    go2rtc only connects a producer once a consumer needs it, so a stream nobody
+    is watching has nothing to describe.
+    """
+    for producer in producers:
+        tracks = _sdp_tracks(producer.get("sdp") or "")
+        codecs = {kind: name for kind, (name, _) in tracks.items()}
+        for kind, name in _medias_codecs(producer.get("medias") or []).items():
+            codecs.setdefault(kind, name)
+        if "video" not in codecs:
+            continue
+
+        media: dict = {"codec": _CODEC_NAMES.get(codecs["video"], codecs["video"].lower())}
+        if "audio" in codecs:
+            media["audio"] = _CODEC_NAMES.get(codecs["audio"], codecs["audio"].lower())
+        if media["codec"] == "h264":
+            media.update(_h264_details(tracks.get("video", ("", {}))[1]))
+        if audio_mime := _AUDIO_MIME.get(media.get("audio", "")):
+            media["audio_mime"] = audio_mime
+        return media
+    return None
@@ -0,0 +1,262 @@
+"""Viewer presence from the Caddy sidecar's JSON log.
+
+Viewers only reach go2rtc through Caddy's `/api/ws` proxy, so Caddy sees every
+WebSocket open and close the moment it happens, while go2rtc's consumer list is
+only polled every 30 s. An ingester follows Caddy's JSON log — tailing a file on
+a shared volume, or listening on a TCP socket for Caddy's `output net` writer —
+and nudges each camera's viewer count between polls:
+
+- open: the reverse proxy's debug "upstream roundtrip" entry with status 101
+  (go2rtc accepted the WebSocket upgrade);
+- close: the access log entry for the same request, written when it ends.
+
+Both carry the client's remote address and port, which pairs a close with its
+open. Cameras sharing one log share one ingester.
+
+The TCP listener does not authenticate its writers: anything that can reach
+the port can move viewer counts (and, with a viewer limit, fill a camera), so
+it should be bound to HA's address on the network it shares with Caddy.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import timedelta
+from http import HTTPStatus
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    PRESENCE_MAX_READ,
+    PRESENCE_MAX_TRACKED,
+    PRESENCE_POLL_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TCP_PREFIX = "tcp://"
+MAX_PORT = 65535
+WILDCARD_HOSTS = frozenset({"0.0.0.0", "::"})  # noqa: S104
+
+
+def parse_tcp_source(source: str) -> tuple[str, int] | None:
+    """Return (host, port) for a tcp://<host>:<port> source, else None."""
+    if not source.startswith(TCP_PREFIX):
+        return None
+    host, sep, port = source[len(TCP_PREFIX) :].rpartition(":")
+    if not sep or not port.isdigit() or not 0 < int(port) <= MAX_PORT:
+        return None
+    return host.strip("[]") or "0.0.0.0", int(port)  # noqa: S104
+
+
+def _parse_entry(line: bytes) -> tuple[bool, str, str] | None:
+    """Return (opened, connection key, stream name) for a viewer WebSocket log entry."""
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(entry, dict) or not isinstance(request := entry.get("request"), dict):
+        return None
+
+    url = urlsplit(request.get("uri") or "")
+    if url.path != "/api/ws" or not (src := parse_qs(url.query).get("src")):
+        return None
+    key = f"{request.get('remote_ip')}:{request.get('remote_port')}"
+
+    if entry.get("msg") == "upstream roundtrip":
+        return (True, key, src[0]) if entry.get("status") == HTTPStatus.SWITCHING_PROTOCOLS else None
+    if str(entry.get("logger", "")).startswith("http.log.access"):
+        return (False, key, src[0])
+    return None
+
+
+def _read_new(path: str, offset: int | None, inode: int | None) -> tuple[bytes, int, int]:
+    """Return bytes appended to `path` since `offset`, plus the new offset and inode.
+
+    A None offset starts at the current end — past entries describe viewers the
+    next poll will count anyway. A new inode or a shrunken file means the log was
+    rotated, so reading restarts from the top.
+    """
+    with open(path, "rb") as file:  # noqa: PTH123
+        stat = os.fstat(file.fileno())
+        if offset is None:
+            return b"", stat.st_size, stat.st_ino
+        if stat.st_ino != inode or stat.st_size < offset:
+            offset = 0
+        file.seek(offset)
+        data = file.read(PRESENCE_MAX_READ)
+    return data, offset + len(data), stat.st_ino
+
+
+class PresenceIngester:
+    """Follows one Caddy JSON log and reports viewer opens/closes to its cameras."""
+
+    def __init__(self, hass: HomeAssistant, source: str) -> None:
+        """Initialise the ingester."""
+        self.hass = hass
+        self.source = source
+        self.coordinators: set[SharedCamCoordinator] = set()
+        # Open viewer connection key → go2rtc stream name, oldest first.
+        self._open: dict[str, str] = {}
+        self._stop: Callable[[], None] | None = None
+        self._offset: int | None = None
+        self._inode: int | None = None
+        self._partial = b""
+        self._reading = False
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @callback
+    def async_register(self, coordinator: SharedCamCoordinator) -> Callable[[], None]:
+        """Start feeding `coordinator`; returns a callback that stops it."""
+        self.coordinators.add(coordinator)
+        if self._stop is None:
+            self._async_start()
+
+        @callback
+        def _unregister() -> None:
+            self.coordinators.discard(coordinator)
+            if not self.coordinators and self._stop is not None:
+                self._stop()
+                self._stop = None
+
+        return _unregister
+
+    @callback
+    def _async_start(self) -> None:
+        """Start tailing the file or listening on the socket."""
+        if (address := parse_tcp_source(self.source)) is not None:
+            task = self.hass.async_create_background_task(
+                self._async_serve(*address), f"{DOMAIN} presence {self.source}"
+            )
+            self._stop = task.cancel
+            return
+
+        self._offset = None
+        self._partial = b""
+        self._stop = async_track_time_interval(
+            self.hass,
+            self._async_poll_file,
+            timedelta(seconds=PRESENCE_POLL_INTERVAL),
+            name=f"{DOMAIN} presence {self.source}",
+        )
+        # Record the current end of the log straight away.
+        self.hass.async_create_task(self._async_poll_file(None))
+
+    async def _async_poll_file(self, _now) -> None:
+        """Read and apply whatever was appended to the log since the last tick."""
+        if self._reading:
+            return
+        self._reading = True
+        try:
+            data, self._offset, self._inode = await self.hass.async_add_executor_job(
+                _read_new, self.source, self._offset, self._inode
+            )
+        except OSError as err:
+            if self._offset is not None:
+                _LOGGER.warning("Cannot read presence log %s: %s", self.source, err)
+            else:
+                _LOGGER.debug("Presence log %s not readable yet: %s", self.source, err)
+            self._offset = None
+            return
+        finally:
+            self._reading = False
+        if data:
+            self._partial = self._async_feed(self._partial + data)
+
+    async def _async_serve(self, host: str, port: int) -> None:
+        """Accept Caddy's log writer connections until cancelled."""
+        try:
+            server = await asyncio.start_server(self._async_handle_writer, host, port)
+        except OSError as err:
+            # A bind failure is a configuration problem; a traceback adds nothing.
+            _LOGGER.error(  # noqa: TRY400
+                "Cannot listen for presence log on %s: %s", self.source, err
+            )
+            return
+        _LOGGER.debug("Listening for Caddy presence log on %s", self.source)
+        if host in WILDCARD_HOSTS:
+            _LOGGER.warning(
+                "Presence log listener %s accepts viewer events from any host that "
+                "can reach it; bind it to HA's address on the network shared with "
+                "Caddy instead",
+                self.source,
+            )
+        async with server:
+            try:
+                await server.serve_forever()
+            finally:
+                # Leaving `async with` waits for every connection to end
+                # (Python 3.12.1+), and Caddy never hangs up on its own.
+                for writer in list(self._writers):
+                    writer.close()
+
+    async def _async_handle_writer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Apply log lines from one connected writer as they arrive."""
+        partial = b""
+        self._writers.add(writer)
+        try:
+            while chunk := await reader.read(PRESENCE_MAX_READ):
+                partial = self._async_feed(partial + chunk)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    @callback
+    def _async_feed(self, data: bytes) -> bytes:
+        """Apply every complete line in `data`; return the incomplete remainder.
+
+        Each affected camera is notified once per batch, so a burst of viewers
+        costs one listener fan-out.
+        """
+        *lines, partial = data.split(b"\n")
+        deltas: Counter[str] = Counter()
+        for line in lines:
+            if not line.strip() or (parsed := _parse_entry(line)) is None:
+                continue
+            opened, key, stream = parsed
+            if opened:
+                self._open[key] = stream
+                deltas[stream] += 1
+                if len(self._open) > PRESENCE_MAX_TRACKED:
+                    del self._open[next(iter(self._open))]
+            elif self._open.pop(key, None) is not None:
+                # Closes of connections opened before we started are already
+                # reflected by the poll.
+                deltas[stream] -= 1
+
+        if deltas:
+            for coordinator in self.coordinators:
+                delta = sum(deltas[name] for name in coordinator.stream_sources)
+                if delta:
+                    coordinator.async_presence_changed(delta)
+        # A line this long is not a Caddy log entry; don't buffer it forever.
+        return partial if len(partial) <= PRESENCE_MAX_READ else b""
+
+
+@callback
+def async_get_presence_ingester(hass: HomeAssistant, source: str) -> PresenceIngester:
+    """Return the ingester for a log file or socket, creating it on first use."""
+    ingesters: dict[str, PresenceIngester] = hass.data[DOMAIN].setdefault(
+        "presence", {}
+    )
+    if source not in ingesters:
+        ingesters[source] = PresenceIngester(hass, source)
+    return ingesters[source]
@@ -0,0 +1,131 @@
+"""Synthetic first-frame latency probe for a shared camera.
+
+Periodically connects to go2rtc's `/api/ws?src=<source>` the way the viewer
+page's player does, requests MSE and times three milestones from the start of
+the connection attempt:
+
+- connect: WebSocket handshake completed;
+- init: first binary message (the MSE init segment);
+- first_frame: second binary message (the first media segment).
+
+The probe then disconnects. Its User-Agent marks it as a probe so it is never
+counted as a viewer or announced as a viewer event.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, PROBE_CODECS, PROBE_TIMEOUT, PROBE_USER_AGENT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProbeError(Exception):
+    """The probe connection ended before the first media segment arrived."""
+
+
+def _ws_url(go2rtc_url: str) -> str:
+    """Return the go2rtc WebSocket endpoint for an http(s) base URL."""
+    parts = urlsplit(go2rtc_url)
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    return urlunsplit((scheme, parts.netloc, f"{parts.path.rstrip('/')}/api/ws", "", ""))
+
+
+async def async_probe_stream(
+    session: aiohttp.ClientSession, go2rtc_url: str, source: str
+) -> dict[str, float]:
+    """Open the stream like a viewer and return connect/init/first_frame in ms.
+
+    Raises ProbeError, aiohttp.ClientError or TimeoutError on failure.
+    """
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+
+    def _mark(milestone: str) -> None:
+        timings[milestone] = round((time.perf_counter() - started) * 1000, 1)
+
+    async with asyncio.timeout(PROBE_TIMEOUT), session.ws_connect(
+        _ws_url(go2rtc_url),
+        params={"src": source},
+        headers={"User-Agent": PROBE_USER_AGENT},
+    ) as ws:
+        _mark("connect")
+        await ws.send_json({"type": "mse", "value": PROBE_CODECS})
+        async for msg in ws:
+            if msg.type is aiohttp.WSMsgType.BINARY:
+                _mark("init" if "init" not in timings else "first_frame")
+                if "first_frame" in timings:
+                    return timings
+            elif msg.type is aiohttp.WSMsgType.TEXT:
+                # go2rtc reports failures (e.g. an unreachable source) as
+                # {"type": "error", "value": "..."}.
+                data = msg.json()
+                if data.get("type") == "error":
+                    raise ProbeError(data.get("value") or "go2rtc error")
+            else:
+                break
+    raise ProbeError("Connection closed before the first media segment")  # noqa: TRY003
+
+
+class SharedCamProbe:
+    """Runs the latency probe for one camera on a fixed interval."""
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: SharedCamCoordinator, interval: int
+    ) -> None:
+        """Initialise the probe."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.interval = interval
+        self._running = False
+
+    @callback
+    def async_start(self) -> Callable[[], None]:
+        """Start probing; returns a callback that stops it."""
+        return async_track_time_interval(
+            self.hass,
+            self._async_run,
+            timedelta(seconds=self.interval),
+            name=f"{DOMAIN} {self.coordinator.camera_name} probe",
+        )
+
+    async def _async_run(self, _now) -> None:
+        """Probe the active source once and publish the result on the coordinator."""
+        coordinator = self.coordinator
+        if self._running or coordinator.data is None:
+            # Nothing to measure while the stream is not shared.
+            return
+        self._running = True
+        try:
+            latency = await async_probe_stream(
+                async_get_clientsession(self.hass),
+                coordinator.go2rtc_url,
+                coordinator.active_source,
+            )
+        except (ProbeError, aiohttp.ClientError, TimeoutError, ValueError) as err:
+            _LOGGER.debug("Probe of '%s' failed: %s", coordinator.camera_name, err)
+            coordinator.latency = dict.fromkeys(coordinator.latency)
+            coordinator.probe_error = str(err) or type(err).__name__
+        else:
+            coordinator.latency = latency
+            coordinator.probe_error = None
+        finally:
+            self._running = False
+        coordinator.async_update_listeners()
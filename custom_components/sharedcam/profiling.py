@@ -0,0 +1,143 @@
+"""On-demand profiling for SharedCam's hot paths (the `sharedcam.profile` service).
+
+While a profile runs, cProfile records everything executed on the event loop —
+coordinator updates, `_build_status_payload` and the SSE loops — and each SSE
+loop additionally reports how long it spent waiting, rendering, encoding and
+writing. At the end a `.prof` file is written to the config directory and a
+short summary of SharedCam's own functions is logged.
+
+cProfile is deterministic, not sampling: it traces every Python call on the
+loop, which slows the loop while it runs and inflates the measured SSE phases
+(render and encode most, being pure Python). It pins down which functions
+dominate, not absolute timings, so runs default to a few seconds.
+"""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+import voluptuous as vol
+
+from .const import DOMAIN, PROFILE_TOP_N, SERVICE_PROFILE
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_SECONDS = "seconds"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SECONDS, default=10): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=300)
+        ),
+    }
+)
+
+SSE_PHASES = ("wait", "render", "encode", "write")
+
+
+class SharedCamProfiler:
+    """Runs one profile at a time and accumulates SSE phase timings while active."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the profiler."""
+        self.hass = hass
+        self.active = False
+        # phase → [total seconds, samples]
+        self._phases: dict[str, list[float]] = {}
+
+    @callback
+    def record_sse(self, wait: float, render: float, encode: float, write: float) -> None:
+        """Add one SSE loop iteration's phase timings (seconds) to the running totals.
+
+        Ignored unless a profile is running.
+        """
+        if not self.active:
+            return
+        for phase, seconds in zip(SSE_PHASES, (wait, render, encode, write), strict=True):
+            totals = self._phases.setdefault(phase, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+
+    async def async_run(self, seconds: float) -> None:
+        """Profile the event loop for `seconds`, then write and log the results."""
+        if self.active:
+            raise HomeAssistantError("A SharedCam profile is already running")  # noqa: TRY003
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Another profiler (e.g. HA's profiler integration) is already attached.
+            raise HomeAssistantError(f"Cannot start profiler: {err}") from err  # noqa: TRY003
+
+        self.active = True
+        self._phases = {}
+        _LOGGER.info("SharedCam profiling started for %.0f s", seconds)
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile.disable()
+            self.active = False
+
+        path = self.hass.config.path(f"sharedcam_profile.{int(time.time())}.prof")
+        summary = await self.hass.async_add_executor_job(_write_profile, profile, path)
+        _LOGGER.info(
+            "SharedCam profile written to %s\n%s\nSSE phases:\n%s",
+            path,
+            summary,
+            self._phase_summary(),
+        )
+
+    def _phase_summary(self) -> str:
+        """Format the accumulated SSE phase timings."""
+        if not self._phases:
+            return "  (no SSE events sent)"
+        lines = []
+        for phase in SSE_PHASES:
+            total, count = self._phases.get(phase, (0.0, 0))
+            mean = total / count if count else 0.0
+            lines.append(
+                f"  {phase:<7} total {total * 1000:9.1f} ms  "
+                f"mean {mean * 1000:7.3f} ms  n={int(count)}"
+            )
+        return "\n".join(lines)
+
+
+def _write_profile(profile: cProfile.Profile, path: str) -> str:
+    """Dump the profile to `path` and return a top-N summary of SharedCam functions."""
+    profile.dump_stats(path)
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(DOMAIN, PROFILE_TOP_N)
+    return stream.getvalue()
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> SharedCamProfiler:
+    """Return the integration-wide profiler, creating it on first use."""
+    data = hass.data[DOMAIN]
+    if "profiler" not in data:
+        data["profiler"] = SharedCamProfiler(hass)
+    return data["profiler"]
+
+
+@callback
+def async_register_profile_service(hass: HomeAssistant) -> None:
+    """Register the `sharedcam.profile` service."""
+
+    async def _async_profile(call: ServiceCall) -> None:
+        await async_get_profiler(hass).async_run(call.data[ATTR_SECONDS])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
@@ -0,0 +1,117 @@
+"""Request throttling for the externally reachable SharedCam HTTP views.
+
+The status and SSE endpoints are proxied to external viewers by the Caddy
+sidecar, so a misbehaving page must not be able to make HA render templates and
+serialise JSON without bound. Each (client, camera) pair gets a token bucket,
+and the number of open SSE streams is capped globally.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+import math
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http.const import KEY_HASS_REFRESH_TOKEN_ID
+from homeassistant.core import callback
+
+from .const import (
+    CLIENT_ADDRESS_HEADER,
+    DOMAIN,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_CLIENTS,
+    RATE_LIMIT_PER_SECOND,
+    SSE_MAX_STREAMS,
+    SSE_RETRY_AFTER,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def _client_key(request: web.Request) -> str:
+    """Return the identity requests are throttled under.
+
+    Behind the Caddy sidecar every request carries the same long-lived token, so
+    the client address Caddy forwards is preferred; direct callers fall back to
+    their refresh token, then to the socket peer address.
+    """
+    forwarded = request.headers.get(CLIENT_ADDRESS_HEADER)
+    if forwarded:
+        return f"addr:{forwarded.strip()}"
+    token_id = request.get(KEY_HASS_REFRESH_TOKEN_ID)
+    if token_id:
+        return f"token:{token_id}"
+    return f"addr:{request.remote}"
+
+
+def _too_many_requests(retry_after: float) -> web.Response:
+    """Return a cheap 429 — no template rendering, no JSON encoding."""
+    return web.Response(
+        status=429,
+        text="Too many requests",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class SharedCamRateLimiter:
+    """Token buckets per (client, camera) plus a global cap on open SSE streams."""
+
+    def __init__(self) -> None:
+        """Initialise the limiter."""
+        # key → (tokens, last refill); least recently used first so the oldest
+        # clients are evicted once RATE_LIMIT_MAX_CLIENTS is reached.
+        self._buckets: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+        self.open_streams = 0
+
+    def _take(self, key: tuple[str, str]) -> float:
+        """Take a token for `key`; return 0 on success or seconds until one is available."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (RATE_LIMIT_BURST, now))
+        tokens = min(RATE_LIMIT_BURST, tokens + (now - updated) * RATE_LIMIT_PER_SECOND)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / RATE_LIMIT_PER_SECOND
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > RATE_LIMIT_MAX_CLIENTS:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    def check(self, request: web.Request, camera_name: str) -> web.Response | None:
+        """Return a 429 response when the client is over its limit, else None."""
+        retry_after = self._take((_client_key(request), camera_name))
+        if retry_after:
+            return _too_many_requests(retry_after)
+        return None
+
+    def open_stream(self) -> web.Response | None:
+        """Claim an SSE slot; return a 503 response when the global cap is reached.
+
+        Callers that get None must call close_stream() when the stream ends.
+        """
+        if self.open_streams >= SSE_MAX_STREAMS:
+            return web.Response(
+                status=503,
+                text="Too many open status streams",
+                headers={"Retry-After": str(SSE_RETRY_AFTER)},
+            )
+        self.open_streams += 1
+        return None
+
+    def close_stream(self) -> None:
+        """Release an SSE slot claimed by open_stream()."""
+        self.open_streams = max(0, self.open_streams - 1)
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant) -> SharedCamRateLimiter:
+    """Return the limiter shared by all SharedCam views, creating it on first use."""
+    data = hass.data[DOMAIN]
+    if "rate_limiter" not in data:
+        data["rate_limiter"] = SharedCamRateLimiter()
+    return data["rate_limiter"]
@@ -0,0 +1,248 @@
+"""Desired-state reconciler — keeps go2rtc's stream registry in line with HA.
+
+go2rtc has no persistent stream config, so every stream vanishes whenever the
+process restarts (OOM, container update, or another camera's disable restart).
+One reconciler exists per go2rtc host; every coordinator on that host hands it
+the raw /api/streams result of each poll, and the reconciler repairs every
+drifted stream on the host in a single concurrent batch.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    RECONCILE_BACKOFF_MAX,
+    RECONCILE_BACKOFF_MIN,
+    RESTART_MIN_STREAMS,
+    RESTART_SETTLE_DELAY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_reconciler(hass: HomeAssistant, go2rtc_url: str) -> SharedCamReconciler:
+    """Return the shared reconciler for a go2rtc host, creating it on first use."""
+    reconcilers: dict[str, SharedCamReconciler] = hass.data[DOMAIN].setdefault(
+        "reconcilers", {}
+    )
+    key = go2rtc_url.rstrip("/")
+    if key not in reconcilers:
+        reconcilers[key] = SharedCamReconciler(hass, key)
+    return reconcilers[key]
+
+
+class SharedCamReconciler:
+    """Compare entry.options["stream_enabled"] with go2rtc for every camera on one host."""
+
+    def __init__(self, hass: HomeAssistant, go2rtc_url: str) -> None:
+        """Initialise the reconciler."""
+        self.hass = hass
+        self.go2rtc_url = go2rtc_url
+        self.restarts = 0
+        self._coordinators: dict[str, SharedCamCoordinator] = {}
+        # Desired stream names (cameras and their variants) present at the previous
+        # reconcile — a mass disappearance from this set is how a go2rtc restart
+        # is detected.
+        self._present: set[str] = set()
+        self._failures: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+        # Outcome of the latest repair batch: stream name → True when re-registered,
+        # False when removed. Polls that waited for the batch apply it to their
+        # own, older snapshot.
+        self._repaired: dict[str, bool] = {}
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_register(self, coordinator: SharedCamCoordinator) -> Callable[[], None]:
+        """Track a coordinator; returns a callback that stops tracking it."""
+        self._coordinators[coordinator.camera_name] = coordinator
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(coordinator.camera_name, None)
+            for name in coordinator.stream_sources:
+                self._present.discard(name)
+                self._failures.pop(name, None)
+                self._retry_at.pop(name, None)
+
+        return _unregister
+
+    @callback
+    def async_request_check(self, source: SharedCamCoordinator) -> None:
+        """Ask another enabled camera on this host to poll (and so reconcile) soon.
+
+        Used after a disable restart, which drops every other stream on the host.
+        The poll is delayed briefly so go2rtc has time to come back up.
+        """
+        for coordinator in self._coordinators.values():
+            if coordinator is not source and coordinator.stream_desired:
+                target = coordinator
+                break
+        else:
+            return
+
+        @callback
+        def _check(_now) -> None:
+            self.hass.async_create_task(target.async_request_refresh())
+
+        async_call_later(self.hass, RESTART_SETTLE_DELAY, _check)
+
+    async def async_reconcile(
+        self, raw: dict, source: SharedCamCoordinator
+    ) -> None:
+        """Repair every stream whose go2rtc state differs from its desired state.
+
+        `raw` is the full /api/streams response polled by `source`; it is patched
+        in place so the polling coordinator sees the repaired state, and every
+        other repaired coordinator is pushed its new state directly.
+        """
+        if self._lock.locked():
+            # Another coordinator's poll is already repairing this host. Wait for
+            # it rather than publish a snapshot taken before its repairs.
+            async with self._lock:
+                for name, registered in self._repaired.items():
+                    if registered:
+                        raw.setdefault(name, {"producers": [], "consumers": []})
+                    else:
+                        raw.pop(name, None)
+            return
+
+        async with self._lock:
+            self._repaired = {}
+            # Stream name → owning coordinator, covering every registered variant.
+            owners = {
+                name: coordinator
+                for coordinator in self._coordinators.values()
+                if not coordinator.stream_busy
+                for name in coordinator.stream_sources
+            }
+            desired = {name for name, coord in owners.items() if coord.stream_desired}
+            present = desired & raw.keys()
+            missing = desired - present
+            stale = {name for name in owners if name not in desired and name in raw}
+
+            retired = self._retired_owners(raw)
+            owners.update(retired)
+            stale |= retired.keys()
+
+            self._detect_restart(missing)
+            self._present = present
+
+            now = time.monotonic()
+            due = [
+                name
+                for name in sorted(missing | stale)
+                if self._retry_at.get(name, 0.0) <= now
+            ]
+            if not due:
+                return
+
+            results = await asyncio.gather(
+                *(
+                    owners[name].async_enable_stream(name)
+                    if name in missing
+                    else owners[name].async_remove_stream(name)
+                    for name in due
+                ),
+                return_exceptions=True,
+            )
+
+            repaired: set[SharedCamCoordinator] = set()
+            for name, result in zip(due, results, strict=True):
+                if isinstance(result, Exception):
+                    self._back_off(name, now, result)
+                    continue
+
+                self._failures.pop(name, None)
+                self._retry_at.pop(name, None)
+                coordinator = owners[name]
+                coordinator.repairs += 1
+                repaired.add(coordinator)
+                self._repaired[name] = name in missing
+                if name in missing:
+                    raw[name] = {"producers": [], "consumers": []}
+                    self._present.add(name)
+                    _LOGGER.info("Re-registered drifted go2rtc stream '%s'", name)
+                else:
+                    raw.pop(name, None)
+                    if name in retired:
+                        coordinator.async_forget_retired({name})
+                    _LOGGER.info(
+                        "Removed go2rtc stream '%s' that is disabled or no longer configured in HA",
+                        name,
+                    )
+
+            for coordinator in repaired - {source}:
+                coordinator.async_set_updated_data(coordinator.stream_data_from(raw))
+
+    @callback
+    def _retired_owners(self, raw: dict) -> dict[str, SharedCamCoordinator]:
+        """Return retired variants still in go2rtc, mapped to the camera that dropped them.
+
+        Variants dropped from a camera's options are deleted whatever its desired
+        state, unless a camera registers the same name today. Names that are no
+        longer in go2rtc are forgotten straight away.
+        """
+        current = {
+            name
+            for coordinator in self._coordinators.values()
+            for name in coordinator.stream_sources
+        }
+        retired: dict[str, SharedCamCoordinator] = {}
+        for coordinator in self._coordinators.values():
+            if coordinator.stream_busy:
+                continue
+            gone = set()
+            for name in coordinator.retired_sources:
+                if name in raw and name not in current:
+                    retired[name] = coordinator
+                else:
+                    gone.add(name)
+            if gone:
+                coordinator.async_forget_retired(gone)
+        return retired
+
+    @callback
+    def _detect_restart(self, missing: set[str]) -> None:
+        """Count a go2rtc restart when enough of the previously present streams vanished."""
+        vanished = self._present & missing
+        if vanished and (
+            len(vanished) >= RESTART_MIN_STREAMS or vanished == self._present
+        ):
+            self.restarts += 1
+            _LOGGER.warning(
+                "go2rtc at %s appears to have restarted — %d enabled stream(s) "
+                "disappeared; re-registering",
+                self.go2rtc_url,
+                len(vanished),
+            )
+
+    @callback
+    def _back_off(self, name: str, now: float, err: Exception) -> None:
+        """Schedule the next repair attempt of a stream after a failed one."""
+        failures = self._failures.get(name, 0) + 1
+        self._failures[name] = failures
+        delay = min(RECONCILE_BACKOFF_MIN * 2 ** (failures - 1), RECONCILE_BACKOFF_MAX)
+        self._retry_at[name] = now + delay
+        _LOGGER.warning(
+            "Failed to repair go2rtc stream '%s' (attempt %d, next try in %ds): %s",
+            name,
+            failures,
+            delay,
+            err,
+        )
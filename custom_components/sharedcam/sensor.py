@@ -1,37 +1,62 @@
-"""Sensor platform for SharedCam — active viewer count."""
+"""Sensor platform for SharedCam — active viewer count and diagnostics."""
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfDataRate, UnitOfTime
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_CAMERA_NAME, CONF_FRIENDLY_NAME, DOMAIN
-from .coordinator import SharedCamCoordinator, _consumer_count
+from .const import CONF_CAMERA_NAME, CONF_FRIENDLY_NAME, CONF_PROBE_INTERVAL, DOMAIN
+from .entity import SharedCamEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .coordinator import SharedCamCoordinator
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,  # runtime_data: SharedCamCoordinator
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up SharedCam viewer sensor from a config entry."""
-    async_add_entities([SharedCamViewersSensor(entry.runtime_data, entry)])
+    """Set up SharedCam sensors from a config entry."""
+    coordinator: SharedCamCoordinator = entry.runtime_data
+    entities: list[SensorEntity] = [
+        SharedCamViewersSensor(coordinator, entry),
+        SharedCamRepairsSensor(coordinator, entry),
+        SharedCamStallsSensor(coordinator, entry),
+        SharedCamBitrateSensor(coordinator, entry, "egress", "Egress bitrate"),
+        SharedCamBitrateSensor(coordinator, entry, "ingest", "Ingest bitrate"),
+        SharedCamBitrateSensor(coordinator, entry, "per_viewer", "Per-viewer bitrate"),
+    ]
+    # Latency sensors only exist while the synthetic probe is enabled.
+    if entry.options.get(CONF_PROBE_INTERVAL):
+        entities += [
+            SharedCamLatencySensor(coordinator, entry, "connect", "Connect latency"),
+            SharedCamLatencySensor(coordinator, entry, "init", "Init segment latency"),
+            SharedCamLatencySensor(
+                coordinator, entry, "first_frame", "First frame latency"
+            ),
+        ]
+    async_add_entities(entities)
 
 
-class SharedCamViewersSensor(CoordinatorEntity[SharedCamCoordinator], SensorEntity):
+class SharedCamViewersSensor(SharedCamEntity, SensorEntity):
     """Sensor reporting the number of active go2rtc stream consumers."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:account-eye"
     _attr_native_unit_of_measurement = "viewers"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _watched_fields = frozenset({"viewers"})
 
     def __init__(
         self, coordinator: SharedCamCoordinator, entry: ConfigEntry
@@ -53,5 +78,179 @@ class SharedCamViewersSensor(CoordinatorEntity[SharedCamCoordinator], SensorEnti
 
     @property
     def native_value(self) -> int:
-        """Return the number of active consumers from the latest coordinator data."""
-        return _consumer_count(self.coordinator.data)
+        """Return the number of active consumers, kept current between polls by presence events."""
+        return self.coordinator.viewer_count
+
+
+class SharedCamRepairsSensor(SharedCamEntity, SensorEntity):
+    """Diagnostic sensor counting drifted streams repaired by the reconciler."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:auto-fix"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _watched_fields = frozenset({"repairs", "restarts"})
+
+    def __init__(
+        self, coordinator: SharedCamCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator)
+        camera_name = entry.data[CONF_CAMERA_NAME]
+        friendly = entry.data.get(CONF_FRIENDLY_NAME) or camera_name
+
+        self._attr_unique_id = f"{DOMAIN}_{camera_name}_repairs"
+        self._attr_name = "Stream repairs"
+        self.entity_id = f"sensor.sharedcam_{camera_name}_repairs"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=friendly,
+            manufacturer="SharedCam",
+            model="go2rtc stream",
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return how many times this camera's stream was re-registered or removed."""
+        return self.coordinator.repairs
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Expose the number of go2rtc restarts detected on this camera's host."""
+        return {"go2rtc_restarts": self.coordinator.reconciler.restarts}
+
+
+class SharedCamStallsSensor(SharedCamEntity, SensorEntity):
+    """Diagnostic sensor counting producer stalls detected on this camera's streams."""
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:motion-pause"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _watched_fields = frozenset({"stalls", "stalled", "stall_recoveries"})
+
+    def __init__(
+        self, coordinator: SharedCamCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator)
+        camera_name = entry.data[CONF_CAMERA_NAME]
+        friendly = entry.data.get(CONF_FRIENDLY_NAME) or camera_name
+
+        self._attr_unique_id = f"{DOMAIN}_{camera_name}_stalls"
+        self._attr_name = "Stream stalls"
+        self.entity_id = f"sensor.sharedcam_{camera_name}_stalls"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=friendly,
+            manufacturer="SharedCam",
+            model="go2rtc stream",
+        )
+
+    @property
+    def native_value(self) -> int:
+        """Return how many times a stream's source stopped delivering with viewers attached."""
+        return self.coordinator.stalls
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Expose whether a stream is stalled right now and how often one was re-registered."""
+        return {
+            "stalled": bool(self.coordinator.stalled),
+            "recoveries": self.coordinator.stall_recoveries,
+        }
+
+
+class SharedCamBitrateSensor(SharedCamEntity, SensorEntity):
+    """Sensor reporting a throughput figure diffed from go2rtc byte counters.
+
+    `key` selects the coordinator throughput value: "egress" (sent to all viewers),
+    "ingest" (received from the source) or "per_viewer" (average egress per viewer).
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:speedometer"
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_native_unit_of_measurement = UnitOfDataRate.KILOBITS_PER_SECOND
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        coordinator: SharedCamCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator)
+        camera_name = entry.data[CONF_CAMERA_NAME]
+        friendly = entry.data.get(CONF_FRIENDLY_NAME) or camera_name
+
+        self._key = key
+        self._watched_fields = frozenset({key})
+        self._attr_unique_id = f"{DOMAIN}_{camera_name}_{key}_bitrate"
+        self._attr_name = name
+        self.entity_id = f"sensor.sharedcam_{camera_name}_{key}_bitrate"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=friendly,
+            manufacturer="SharedCam",
+            model="go2rtc stream",
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the bitrate in kbit/s, or None until two polls have been diffed."""
+        bps = self.coordinator.throughput[self._key]
+        return None if bps is None else bps / 1000
+
+
+class SharedCamLatencySensor(SharedCamEntity, SensorEntity):
+    """Sensor reporting a milestone time of the synthetic viewer probe (see probe.py).
+
+    `key` selects the milestone: "connect" (WebSocket open), "init" (MSE init
+    segment) or "first_frame" (first media segment), all timed from the start
+    of the connection attempt.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        coordinator: SharedCamCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+    ) -> None:
+        """Initialise the sensor."""
+        super().__init__(coordinator)
+        camera_name = entry.data[CONF_CAMERA_NAME]
+        friendly = entry.data.get(CONF_FRIENDLY_NAME) or camera_name
+
+        self._key = key
+        self._watched_fields = frozenset({f"latency_{key}", "probe_error"})
+        self._attr_unique_id = f"{DOMAIN}_{camera_name}_{key}_latency"
+        self._attr_name = name
+        self.entity_id = f"sensor.sharedcam_{camera_name}_{key}_latency"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=friendly,
+            manufacturer="SharedCam",
+            model="go2rtc stream",
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latest probe time in ms, or None before a successful probe."""
+        return self.coordinator.latency[self._key]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, str | None]:
+        """Expose why the latest probe failed, if it did."""
+        return {"error": self.coordinator.probe_error}
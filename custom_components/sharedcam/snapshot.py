@@ -0,0 +1,122 @@
+"""Cached poster frames for the viewer page, grabbed from go2rtc's frame API.
+
+Viewers opening the page at the same time all ask for the same poster. Frames
+are kept in a byte cache with a TTL and a total memory budget, and concurrent
+requests for a camera whose frame is missing or stale share one upstream grab —
+a hundred simultaneous page loads cost go2rtc one frame.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    SNAPSHOT_FETCH_TIMEOUT,
+    SNAPSHOT_MAX_BYTES,
+    SNAPSHOT_MAX_FRAME_BYTES,
+    SNAPSHOT_TTL,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """One cached JPEG frame."""
+
+    __slots__ = ("etag", "fetched", "frame")
+
+    def __init__(self, frame: bytes) -> None:
+        """Initialise the snapshot, deriving a strong ETag from its content."""
+        self.frame = frame
+        self.etag = f'"{hashlib.blake2b(frame, digest_size=12).hexdigest()}"'
+        self.fetched = time.monotonic()
+
+    @property
+    def max_age(self) -> int:
+        """Return whole seconds until the frame expires."""
+        return max(0, int(SNAPSHOT_TTL - (time.monotonic() - self.fetched)))
+
+
+class SnapshotCache:
+    """LRU byte cache of per-camera frames with TTL, memory budget and single-flight fetches."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the cache."""
+        self.hass = hass
+        self._entries: OrderedDict[str, Snapshot] = OrderedDict()
+        self._size = 0
+        self._inflight: dict[str, asyncio.Future[Snapshot]] = {}
+
+    async def async_get(self, coordinator: SharedCamCoordinator) -> Snapshot:
+        """Return a fresh frame for the camera, fetching it at most once at a time.
+
+        Raises whatever the upstream fetch raised to every waiting caller.
+        """
+        camera_name = coordinator.camera_name
+        cached = self._entries.get(camera_name)
+        if cached is not None and time.monotonic() - cached.fetched < SNAPSHOT_TTL:
+            self._entries.move_to_end(camera_name)
+            return cached
+
+        future = self._inflight.get(camera_name)
+        if future is None:
+            future = self.hass.loop.create_future()
+            self._inflight[camera_name] = future
+            self.hass.async_create_task(self._async_fetch(coordinator, future))
+        # Shield so one disconnecting viewer does not cancel the shared fetch.
+        return await asyncio.shield(future)
+
+    async def _async_fetch(
+        self, coordinator: SharedCamCoordinator, future: asyncio.Future[Snapshot]
+    ) -> None:
+        """Grab one frame from go2rtc and resolve every waiter with it."""
+        camera_name = coordinator.camera_name
+        try:
+            # A hung go2rtc would otherwise leave every waiter (and the slot in
+            # _inflight) stuck for good.
+            async with asyncio.timeout(SNAPSHOT_FETCH_TIMEOUT):
+                frame = await coordinator.async_fetch_frame()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Snapshot grab for '%s' failed: %s", camera_name, err)
+            future.set_exception(err)
+            # Waiters may all have gone; don't log "exception never retrieved".
+            future.exception()
+        else:
+            snapshot = Snapshot(frame)
+            self._store(camera_name, snapshot)
+            future.set_result(snapshot)
+        finally:
+            self._inflight.pop(camera_name, None)
+
+    def _store(self, camera_name: str, snapshot: Snapshot) -> None:
+        """Cache a frame, evicting least recently used frames beyond the memory budget."""
+        if old := self._entries.pop(camera_name, None):
+            self._size -= len(old.frame)
+        if len(snapshot.frame) > SNAPSHOT_MAX_FRAME_BYTES:
+            return
+        self._entries[camera_name] = snapshot
+        self._size += len(snapshot.frame)
+        while self._size > SNAPSHOT_MAX_BYTES:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.frame)
+
+
+@callback
+def async_get_snapshot_cache(hass: HomeAssistant) -> SnapshotCache:
+    """Return the integration-wide snapshot cache, creating it on first use."""
+    data = hass.data[DOMAIN]
+    if "snapshot_cache" not in data:
+        data["snapshot_cache"] = SnapshotCache(hass)
+    return data["snapshot_cache"]
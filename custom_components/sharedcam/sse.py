@@ -0,0 +1,151 @@
+"""SSE subscriber bookkeeping for SharedCam — one shared keepalive ticker per camera.
+
+Rather than every SSE connection arming its own 15 s timeout just to emit
+`: keepalive`, each camera keeps a single interval timer that, in one pass,
+wakes the handler loop of every idle subscriber to write the keepalive comment.
+The tick itself creates no tasks. Subscribers that were sent a real event within
+the last half period are skipped, so no client goes more than 1.5 periods
+without hearing from us, and so are subscribers whose previous write is still
+waiting on a slow client.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import CONF_SSE_KEEPALIVE, DEFAULT_SSE_KEEPALIVE, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from aiohttp import web
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SharedCamCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+
+class SSESubscriber:
+    """One open SSE response and the event that wakes its handler loop."""
+
+    def __init__(self, response: web.StreamResponse) -> None:
+        """Initialise the subscriber."""
+        self.response = response
+        self.change_event = asyncio.Event()
+        self.closed = False
+        # True while a write is in flight — a client applying backpressure.
+        self.writing = False
+        # Why the handler loop was woken: a status change and/or a keepalive.
+        self.changed = False
+        self.keepalive_due = False
+        self.last_write = time.monotonic()
+
+    @callback
+    def async_notify_change(self) -> None:
+        """Wake the handler loop to send the current status payload."""
+        self.changed = True
+        self.change_event.set()
+
+    @callback
+    def async_request_keepalive(self) -> None:
+        """Wake the handler loop to write the keepalive comment."""
+        self.keepalive_due = True
+        self.change_event.set()
+
+    async def async_send(self, frame: bytes) -> bool:
+        """Write a frame; return False and mark the subscriber closed if the client is gone."""
+        self.writing = True
+        try:
+            await self.response.write(frame)
+        except (ConnectionResetError, ConnectionError):
+            self.closed = True
+            return False
+        finally:
+            self.writing = False
+        self.last_write = time.monotonic()
+        self.keepalive_due = False
+        return True
+
+
+class SSEChannel:
+    """All SSE subscribers of one camera, sharing a single keepalive timer."""
+
+    def __init__(self, hass: HomeAssistant, camera_name: str) -> None:
+        """Initialise the channel."""
+        self.hass = hass
+        self.camera_name = camera_name
+        self.subscribers: set[SSESubscriber] = set()
+        self._period = DEFAULT_SSE_KEEPALIVE
+        self._unsub_timer: Callable[[], None] | None = None
+
+    @callback
+    def async_add(
+        self, response: web.StreamResponse, coordinator: SharedCamCoordinator
+    ) -> SSESubscriber:
+        """Register a subscriber, (re)starting the ticker if needed."""
+        subscriber = SSESubscriber(response)
+        self.subscribers.add(subscriber)
+
+        # Options are read live, so a changed period takes effect on the next connect.
+        period = int(
+            coordinator.config_entry.options.get(
+                CONF_SSE_KEEPALIVE, DEFAULT_SSE_KEEPALIVE
+            )
+        )
+        if self._unsub_timer is not None and period != self._period:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._unsub_timer is None:
+            self._period = period
+            self._unsub_timer = async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=period),
+                name=f"{DOMAIN} {self.camera_name} SSE keepalive",
+            )
+        return subscriber
+
+    @callback
+    def async_remove(self, subscriber: SSESubscriber) -> None:
+        """Drop a subscriber, stopping the ticker once the channel is empty."""
+        self.subscribers.discard(subscriber)
+        if not self.subscribers and self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def _async_tick(self, _now) -> None:
+        """Ask every subscriber idle since mid-period for a keepalive."""
+        cutoff = time.monotonic() - self._period / 2
+        idle = [
+            sub
+            for sub in self.subscribers
+            if not sub.closed and not sub.writing and sub.last_write <= cutoff
+        ]
+        for sub in idle:
+            sub.async_request_keepalive()
+        if idle:
+            _LOGGER.debug(
+                "Requested SSE keepalive from %d/%d subscriber(s) of '%s'",
+                len(idle),
+                len(self.subscribers),
+                self.camera_name,
+            )
+
+
+@callback
+def async_get_channel(hass: HomeAssistant, camera_name: str) -> SSEChannel:
+    """Return the SSE channel for a camera, creating it on first use."""
+    channels: dict[str, SSEChannel] = hass.data[DOMAIN].setdefault("sse_channels", {})
+    if camera_name not in channels:
+        channels[camera_name] = SSEChannel(hass, camera_name)
+    return channels[camera_name]
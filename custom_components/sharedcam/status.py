@@ -0,0 +1,121 @@
+"""Status payload and change tracking shared by every SharedCam status consumer.
+
+The HTTP views, the static exporter and the websocket API all publish the same
+payload and re-send it on the same triggers: a status-relevant coordinator
+change (see STATUS_FIELDS) or a new rendering of the status template.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.template import Template
+
+from .const import CONF_SHOW_VIEWERS, CONF_STATUS_TEMPLATE, DOMAIN
+from .coordinator import STATUS_FIELDS, SharedCamCoordinator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _find_coordinator(hass: HomeAssistant, camera_name: str) -> SharedCamCoordinator | None:
+    """Look up the coordinator for a given camera name via config entry runtime_data."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        coord = getattr(entry, "runtime_data", None)
+        if isinstance(coord, SharedCamCoordinator) and coord.camera_name == camera_name:
+            return coord
+    return None
+
+
+def _unavailable_payload() -> dict:
+    """Return the payload published while the stream is not shared."""
+    return {"available": False, "message": "Stream not available at this time"}
+
+
+def _build_status_payload(hass: HomeAssistant, coordinator: SharedCamCoordinator) -> dict:
+    """Build the status payload.
+
+    Returns a disabled indicator when the stream is not registered in go2rtc.
+    Otherwise returns the go2rtc source new viewers should connect to, viewer
+    count, free viewer slots (when a viewer limit is set), the source's codec
+    and frame size once go2rtc has described them, and the rendered status
+    template (if configured). "stalled" is added while go2rtc lists the stream
+    but its source has stopped delivering.
+    """
+    if coordinator.data is None:
+        return _unavailable_payload()
+
+    payload: dict = {"available": True, "source": coordinator.active_source}
+    if coordinator.config_entry.options.get(CONF_SHOW_VIEWERS, True):
+        payload["viewers"] = coordinator.viewer_count
+    if (slots := coordinator.admission.slots) is not None:
+        payload["slots"] = slots
+        payload["full"] = not slots
+    if coordinator.stalled:
+        payload["stalled"] = True
+    if media := coordinator.media:
+        payload["media"] = media
+
+    template_str: str | None = coordinator.config_entry.options.get(CONF_STATUS_TEMPLATE)
+    if template_str:
+        try:
+            rendered = Template(template_str, hass).async_render(parse_result=False)
+            payload["status"] = rendered.strip()
+        except Exception:  # noqa: BLE001
+            _LOGGER.warning(
+                "Failed to render status template for '%s'", coordinator.camera_name
+            )
+
+    return payload
+
+
+@callback
+def async_track_status(
+    hass: HomeAssistant,
+    coordinator: SharedCamCoordinator,
+    action: Callable[[], None],
+) -> Callable[[], None]:
+    """Call `action` whenever the camera's status payload may have changed.
+
+    go2rtc has no push events, so the coordinator side fires at most once per
+    30 s poll, and only when the stream state, viewer count or active source
+    changed. async_track_template_result auto-discovers every entity the status
+    template references and fires whenever its rendered output changes.
+    Returns a callback that stops tracking.
+    """
+
+    @callback
+    def _on_coordinator_update() -> None:
+        if coordinator.changed_fields & STATUS_FIELDS:
+            action()
+
+    unsubs: list[Callable[[], None]] = [
+        coordinator.async_add_listener(_on_coordinator_update)
+    ]
+
+    template_str: str | None = coordinator.config_entry.options.get(CONF_STATUS_TEMPLATE)
+    if template_str:
+
+        @callback
+        def _on_template_result(event, updates) -> None:
+            action()
+
+        result_info = async_track_template_result(
+            hass,
+            [TrackTemplate(Template(template_str, hass), None)],
+            _on_template_result,
+        )
+        unsubs.append(result_info.async_remove)
+
+    @callback
+    def _unsub() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    return _unsub
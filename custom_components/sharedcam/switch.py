@@ -6,16 +6,17 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_CAMERA_NAME, CONF_FRIENDLY_NAME, DOMAIN
-from .coordinator import SharedCamCoordinator
+from .const import CONF_CAMERA_NAME, CONF_FRIENDLY_NAME, CONF_STREAM_ENABLED, DOMAIN
+from .entity import SharedCamEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .coordinator import SharedCamCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -28,10 +29,11 @@ async def async_setup_entry(
     async_add_entities([SharedCamSwitch(entry.runtime_data, entry)])
 
 
-class SharedCamSwitch(CoordinatorEntity[SharedCamCoordinator], SwitchEntity):
+class SharedCamSwitch(SharedCamEntity, SwitchEntity):
     """Switch that enables (PUT /api/streams) or disables (DELETE + restart) a stream."""
 
     _attr_has_entity_name = True
+    _watched_fields = frozenset({"enabled"})
 
     def __init__(
         self, coordinator: SharedCamCoordinator, entry: ConfigEntry
@@ -75,7 +77,7 @@ class SharedCamSwitch(CoordinatorEntity[SharedCamCoordinator], SwitchEntity):
         # Persist enabled state so it survives HA restarts
         self.hass.config_entries.async_update_entry(
             self.coordinator.config_entry,
-            options={**self.coordinator.config_entry.options, "stream_enabled": True},
+            options={**self.coordinator.config_entry.options, CONF_STREAM_ENABLED: True},
         )
         # Optimistic immediate update — don't wait for the 30s poll cycle.
         # Set stream data to an empty (no consumers yet) but present entry.
@@ -94,7 +96,7 @@ class SharedCamSwitch(CoordinatorEntity[SharedCamCoordinator], SwitchEntity):
         # Persist disabled state
         self.hass.config_entries.async_update_entry(
             self.coordinator.config_entry,
-            options={**self.coordinator.config_entry.options, "stream_enabled": False},
+            options={**self.coordinator.config_entry.options, CONF_STREAM_ENABLED: False},
         )
         # None = stream not registered in go2rtc — immediately reflected across all entities
         self.coordinator.async_set_updated_data(None)
@@ -1,58 +1,28 @@
-"""HTTP views for SharedCam — status JSON endpoint and SSE stream."""
+"""HTTP views for SharedCam — status JSON endpoint, SSE stream, poster snapshot and admission."""
 from __future__ import annotations
 
 import asyncio
 import json
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
-from homeassistant.helpers.template import Template
 
-from .const import CONF_SHOW_VIEWERS, CONF_STATUS_TEMPLATE, DOMAIN
-from .coordinator import SharedCamCoordinator, _consumer_count
+from .const import ADMIT_RETRY_AFTER
+from .profiling import async_get_profiler
+from .ratelimit import async_get_rate_limiter
+from .snapshot import async_get_snapshot_cache
+from .sse import KEEPALIVE_FRAME, async_get_channel
+from .status import _build_status_payload, _find_coordinator, async_track_status
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-_LOGGER = logging.getLogger(__name__)
-
-
-def _find_coordinator(hass: HomeAssistant, camera_name: str) -> SharedCamCoordinator | None:
-    """Look up the coordinator for a given camera name via config entry runtime_data."""
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        coord = getattr(entry, "runtime_data", None)
-        if isinstance(coord, SharedCamCoordinator) and coord.camera_name == camera_name:
-            return coord
-    return None
-
-
-def _build_status_payload(hass: HomeAssistant, coordinator: SharedCamCoordinator) -> dict:
-    """Build the status payload.
-
-    Returns a disabled indicator when the stream is not registered in go2rtc.
-    Otherwise returns viewer count plus the rendered status template (if configured).
-    """
-    if coordinator.data is None:
-        return {"available": False, "message": "Stream not available at this time"}
+    from .coordinator import SharedCamCoordinator
 
-    payload: dict = {"available": True}
-    if coordinator.config_entry.options.get(CONF_SHOW_VIEWERS, True):
-        payload["viewers"] = _consumer_count(coordinator.data)
-
-    template_str: str | None = coordinator.config_entry.options.get(CONF_STATUS_TEMPLATE)
-    if template_str:
-        try:
-            rendered = Template(template_str, hass).async_render(parse_result=False)
-            payload["status"] = rendered.strip()
-        except Exception:  # noqa: BLE001
-            _LOGGER.warning(
-                "Failed to render status template for '%s'", coordinator.camera_name
-            )
-
-    return payload
+_LOGGER = logging.getLogger(__name__)
 
 
 class SharedCamStatusView(HomeAssistantView):
@@ -65,6 +35,10 @@ class SharedCamStatusView(HomeAssistantView):
     async def get(self, request: web.Request, camera_name: str) -> web.Response:
         """Return a JSON status payload for the given camera."""
         hass: HomeAssistant = request.app["hass"]
+        limiter = async_get_rate_limiter(hass)
+        if (limited := limiter.check(request, camera_name)) is not None:
+            return limited
+
         coordinator = _find_coordinator(hass, camera_name)
         if coordinator is None:
             return web.json_response({"error": "Camera not found"}, status=404)
@@ -77,7 +51,12 @@ class SharedCamEventsView(HomeAssistantView):
 
     Pushes an event whenever:
     - The rendered output of the status template changes (tracks all referenced entities)
-    - The go2rtc viewer count or stream enabled state changes (coordinator poll, 30 s)
+    - The go2rtc viewer count, stream enabled state or active source variant
+      changes (coordinator poll, 30 s)
+
+    Idle connections are kept open by the camera's shared keepalive ticker (see sse.py).
+    Both views are throttled per client and camera, and open streams are capped
+    globally (see ratelimit.py).
     """
 
     url = "/api/sharedcam/status/{camera_name}/events"
@@ -87,10 +66,30 @@ class SharedCamEventsView(HomeAssistantView):
     async def get(self, request: web.Request, camera_name: str) -> web.Response:
         """Open an SSE stream for the given camera."""
         hass: HomeAssistant = request.app["hass"]
+        limiter = async_get_rate_limiter(hass)
+        if (limited := limiter.check(request, camera_name)) is not None:
+            return limited
+
         coordinator = _find_coordinator(hass, camera_name)
         if coordinator is None:
             return web.Response(text="Camera not found", status=404)
 
+        if (rejected := limiter.open_stream()) is not None:
+            return rejected
+        try:
+            return await self._async_stream(hass, request, coordinator)
+        finally:
+            limiter.close_stream()
+
+    async def _async_stream(
+        self,
+        hass: HomeAssistant,
+        request: web.Request,
+        coordinator: SharedCamCoordinator,
+    ) -> web.StreamResponse:
+        """Serve the SSE stream until the client disconnects."""
+        camera_name = coordinator.camera_name
+
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         response.headers["Cache-Control"] = "no-cache"
@@ -99,61 +98,130 @@ class SharedCamEventsView(HomeAssistantView):
         response.headers["X-Accel-Buffering"] = "no"
         await response.prepare(request)
 
+        # Keepalives are written by the camera's shared ticker, not by this loop.
+        channel = async_get_channel(hass, camera_name)
+        subscriber = channel.async_add(response, coordinator)
+        change_event = subscriber.change_event
+
         # Send initial snapshot immediately so the page doesn't have to wait
         initial = json.dumps(_build_status_payload(hass, coordinator))
-        await response.write(f"data: {initial}\n\n".encode())
+        if not await subscriber.async_send(f"data: {initial}\n\n".encode()):
+            channel.async_remove(subscriber)
+            return response
 
-        change_event = asyncio.Event()
-
-        # --- Status template subscription ---
-        # async_track_template_result auto-discovers all entities referenced in the
-        # template and fires whenever the rendered output changes.
-        template_str: str | None = coordinator.config_entry.options.get(CONF_STATUS_TEMPLATE)
-
-        def _on_template_result(event, updates) -> None:
-            change_event.set()
-
-        if template_str:
-            result_info = async_track_template_result(
-                hass,
-                [TrackTemplate(Template(template_str, hass), None)],
-                _on_template_result,
-            )
-            unsub_template = result_info.async_remove
-        else:
-            def unsub_template() -> None:
-                pass  # no status template configured
-
-        # --- Coordinator listener for stream state / viewer count delta ---
-        # go2rtc has no push events; coordinator polls every 30 s.
-        # Push an SSE event when the stream is enabled/disabled or viewer count changes.
-        last_viewer_count: list[int] = [_consumer_count(coordinator.data)]
-        last_enabled: list[bool] = [coordinator.data is not None]
-
-        def _on_coordinator_update() -> None:
-            new_count = _consumer_count(coordinator.data)
-            new_enabled = coordinator.data is not None
-            if new_count != last_viewer_count[0] or new_enabled != last_enabled[0]:
-                last_viewer_count[0] = new_count
-                last_enabled[0] = new_enabled
-                change_event.set()
-
-        unsub_coordinator = coordinator.async_add_listener(_on_coordinator_update)
+        # Wake the loop on status template renders and on stream state, viewer
+        # count or source changes from the coordinator (see status.py).
+        unsub_status = async_track_status(
+            hass, coordinator, subscriber.async_notify_change
+        )
 
+        profiler = async_get_profiler(hass)
         try:
             while True:
-                try:
-                    await asyncio.wait_for(change_event.wait(), timeout=15.0)
-                    change_event.clear()
-                    payload = json.dumps(_build_status_payload(hass, coordinator))
-                    await response.write(f"data: {payload}\n\n".encode())
-                except asyncio.TimeoutError:  # noqa: PERF203
-                    # Keepalive comment — prevents proxy / browser from closing idle connection
-                    await response.write(b": keepalive\n\n")
+                started = time.perf_counter()
+                await change_event.wait()
+                change_event.clear()
+                if not subscriber.changed:
+                    # Woken by the camera's shared keepalive ticker.
+                    if subscriber.keepalive_due and not await subscriber.async_send(
+                        KEEPALIVE_FRAME
+                    ):
+                        break
+                    continue
+                subscriber.changed = False
+                woken = time.perf_counter()
+                status = _build_status_payload(hass, coordinator)
+                rendered = time.perf_counter()
+                payload = json.dumps(status)
+                encoded = time.perf_counter()
+                if not await subscriber.async_send(f"data: {payload}\n\n".encode()):
+                    break
+                profiler.record_sse(
+                    woken - started,
+                    rendered - woken,
+                    encoded - rendered,
+                    time.perf_counter() - encoded,
+                )
         except (asyncio.CancelledError, ConnectionResetError, ConnectionError):
             pass
         finally:
-            unsub_template()
-            unsub_coordinator()
+            channel.async_remove(subscriber)
+            unsub_status()
 
         return response
+
+
+class SharedCamSnapshotView(HomeAssistantView):
+    """GET /api/sharedcam/snapshot/{camera_name} — cached JPEG poster frame.
+
+    Frames come from go2rtc's frame API through a shared cache (see snapshot.py)
+    and carry an ETag, so revalidating browsers get a bodiless 304.
+    """
+
+    url = "/api/sharedcam/snapshot/{camera_name}"
+    name = "api:sharedcam:snapshot"
+    requires_auth = True  # Caddy proxy supplies Bearer token
+
+    async def get(self, request: web.Request, camera_name: str) -> web.Response:
+        """Return the camera's current poster frame."""
+        hass: HomeAssistant = request.app["hass"]
+        limiter = async_get_rate_limiter(hass)
+        if (limited := limiter.check(request, camera_name)) is not None:
+            return limited
+
+        coordinator = _find_coordinator(hass, camera_name)
+        if coordinator is None:
+            return web.Response(text="Camera not found", status=404)
+        if coordinator.data is None:
+            # Don't ask go2rtc to pull a stream that is not shared.
+            return web.Response(text="Stream not available", status=404)
+
+        try:
+            snapshot = await async_get_snapshot_cache(hass).async_get(coordinator)
+        except Exception:  # noqa: BLE001
+            return web.Response(text="Snapshot unavailable", status=502)
+
+        headers = {
+            "ETag": snapshot.etag,
+            "Cache-Control": f"private, max-age={snapshot.max_age}",
+        }
+        if snapshot.etag in request.headers.get("If-None-Match", ""):
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            body=snapshot.frame, content_type="image/jpeg", headers=headers
+        )
+
+
+class SharedCamAdmitView(HomeAssistantView):
+    """POST /api/sharedcam/admit/{camera_name} — reserve a viewer slot.
+
+    With a viewer limit configured, the viewer page calls this before opening
+    go2rtc's WebSocket. 200 holds a slot briefly (see admission.py); 503 with
+    Retry-After means the camera is full. Without a limit every viewer is admitted.
+    """
+
+    url = "/api/sharedcam/admit/{camera_name}"
+    name = "api:sharedcam:admit"
+    requires_auth = True  # Caddy proxy supplies Bearer token
+
+    async def post(self, request: web.Request, camera_name: str) -> web.Response:
+        """Reserve a slot for one viewer of the given camera."""
+        hass: HomeAssistant = request.app["hass"]
+        limiter = async_get_rate_limiter(hass)
+        if (limited := limiter.check(request, camera_name)) is not None:
+            return limited
+
+        coordinator = _find_coordinator(hass, camera_name)
+        if coordinator is None:
+            return web.json_response({"error": "Camera not found"}, status=404)
+        if coordinator.data is None:
+            return web.json_response({"error": "Stream not available"}, status=404)
+
+        admission = coordinator.admission
+        if not admission.async_reserve():
+            return web.json_response(
+                {"admitted": False, "full": True, "slots": 0},
+                status=503,
+                headers={"Retry-After": str(ADMIT_RETRY_AFTER)},
+            )
+        return web.json_response({"admitted": True, "slots": admission.slots})
@@ -0,0 +1,149 @@
+"""Websocket API for SharedCam — live status subscriptions on HA's own connection.
+
+Dashboards inside HA get the same payload as the SSE view without holding an
+extra HTTP stream: `sharedcam/subscribe_status` follows one camera and
+`sharedcam/subscribe_all` follows every camera loaded when it subscribes.
+
+A reload replaces a camera's coordinator, so when a followed camera's entry
+unloads the subscription ends with an `entry_unloaded` error and the client
+subscribes again.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+import voluptuous as vol
+
+from .const import DOMAIN
+from .coordinator import SharedCamCoordinator
+from .status import _build_status_payload, _find_coordinator, async_track_status
+
+ERR_ENTRY_UNLOADED = "entry_unloaded"
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the SharedCam websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_status)
+    websocket_api.async_register_command(hass, ws_subscribe_all)
+
+
+@callback
+def _async_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    coordinators: list[SharedCamCoordinator],
+    wrap: Callable[[str, dict], dict[str, Any]],
+) -> None:
+    """Send each camera's payload now and again whenever it changes.
+
+    Payloads are compared with the last one sent, so a trigger that does not
+    change what the subscriber sees (e.g. a hidden viewer count) sends nothing.
+    """
+    last_sent: dict[str, dict] = {}
+
+    def _sender(coordinator: SharedCamCoordinator) -> Callable[[], None]:
+        @callback
+        def _send() -> None:
+            payload = _build_status_payload(hass, coordinator)
+            if last_sent.get(coordinator.camera_name) == payload:
+                return
+            last_sent[coordinator.camera_name] = payload
+            connection.send_message(
+                websocket_api.event_message(
+                    msg_id, wrap(coordinator.camera_name, payload)
+                )
+            )
+
+        return _send
+
+    senders = [(coordinator, _sender(coordinator)) for coordinator in coordinators]
+    unsubs = [
+        async_track_status(hass, coordinator, send) for coordinator, send in senders
+    ]
+
+    @callback
+    def _unsub() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    def _closer(coordinator: SharedCamCoordinator) -> Callable[[], None]:
+        @callback
+        def _close() -> None:
+            if connection.subscriptions.pop(msg_id, None) is None:
+                return
+            _unsub()
+            connection.send_error(
+                msg_id,
+                ERR_ENTRY_UNLOADED,
+                f"Camera '{coordinator.camera_name}' was unloaded; subscribe again",
+            )
+
+        return _close
+
+    unsubs.extend(
+        coordinator.async_on_close(_closer(coordinator)) for coordinator in coordinators
+    )
+
+    connection.subscriptions[msg_id] = _unsub
+    connection.send_result(msg_id)
+    for _, send in senders:
+        send()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_status",
+        vol.Required("camera"): str,
+    }
+)
+@callback
+def ws_subscribe_status(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to one camera's status; events carry the bare payload."""
+    coordinator = _find_coordinator(hass, msg["camera"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Camera not found"
+        )
+        return
+    _async_subscribe(
+        hass, connection, msg["id"], [coordinator], lambda _camera, payload: payload
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/subscribe_all"})
+@callback
+def ws_subscribe_all(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to every loaded camera; events carry {"cameras": {name: payload}}.
+
+    One event per camera is sent straight away, then one whenever a camera's
+    payload changes.
+    """
+    coordinators = [
+        entry.runtime_data
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if isinstance(getattr(entry, "runtime_data", None), SharedCamCoordinator)
+    ]
+    _async_subscribe(
+        hass,
+        connection,
+        msg["id"],
+        coordinators,
+        lambda camera, payload: {"cameras": {camera: payload}},
+    )
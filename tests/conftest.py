@@ -17,8 +17,45 @@ try:
 except Exception:
     pass
 
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.sharedcam.const import (
+    CONF_CAMERA_NAME,
+    CONF_FRIGATE_URL,
+    CONF_GO2RTC_URL,
+    DOMAIN,
+)
+from custom_components.sharedcam.coordinator import SharedCamCoordinator
+
+ENTRY_DATA = {
+    CONF_GO2RTC_URL: "http://go2rtc.example.com:1984",
+    CONF_FRIGATE_URL: "rtsp://frigate.example.com:8554",
+    CONF_CAMERA_NAME: "front_door",
+}
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations for all tests."""
     yield
+
+
+@pytest.fixture
+def make_coordinator(hass):
+    """Return a factory attaching a coordinator to an un-setup entry (no go2rtc traffic)."""
+
+    def _make(
+        camera_name: str = "front_door", options: dict | None = None
+    ) -> SharedCamCoordinator:
+        hass.data.setdefault(DOMAIN, {})
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=camera_name,
+            data={**ENTRY_DATA, CONF_CAMERA_NAME: camera_name},
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        entry.runtime_data = SharedCamCoordinator(hass, entry)
+        return entry.runtime_data
+
+    return _make
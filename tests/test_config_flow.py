@@ -11,8 +11,12 @@ from custom_components.sharedcam.const import (
     CONF_FRIENDLY_NAME,
     CONF_FRIGATE_URL,
     CONF_GO2RTC_URL,
+    CONF_RETIRED_STREAMS,
     CONF_SHOW_VIEWERS,
+    CONF_SSE_KEEPALIVE,
     CONF_STATUS_TEMPLATE,
+    CONF_SUB_STREAM,
+    DEFAULT_SSE_KEEPALIVE,
     DOMAIN,
 )
 
@@ -121,6 +125,7 @@ async def test_full_flow_creates_entry(hass, mock_validate_ok):
     assert result["data"][CONF_GO2RTC_URL] == VALID_USER_INPUT[CONF_GO2RTC_URL]
     assert result["data"][CONF_FRIGATE_URL] == VALID_USER_INPUT[CONF_FRIGATE_URL]
     assert result["options"][CONF_SHOW_VIEWERS] is True
+    assert result["options"][CONF_SSE_KEEPALIVE] == DEFAULT_SSE_KEEPALIVE
 
 
 async def test_friendly_name_used_as_title(hass, mock_validate_ok):
@@ -233,7 +238,7 @@ async def test_options_flow_shows_form(hass):
 
 
 async def test_options_flow_saves_values(hass):
-    """Options flow persists updated show_viewers and status_template."""
+    """Options flow persists updated show_viewers, status_template and keepalive."""
     entry = MockConfigEntry(
         domain=DOMAIN,
         unique_id="front_door",
@@ -248,8 +253,46 @@ async def test_options_flow_saves_values(hass):
         user_input={
             CONF_SHOW_VIEWERS: False,
             CONF_STATUS_TEMPLATE: "{{ states('sensor.temp') }}",
+            CONF_SSE_KEEPALIVE: 30,
         },
     )
     assert result["type"] == FlowResultType.CREATE_ENTRY
     assert result["data"][CONF_SHOW_VIEWERS] is False
     assert result["data"][CONF_STATUS_TEMPLATE] == "{{ states('sensor.temp') }}"
+    assert result["data"][CONF_SSE_KEEPALIVE] == 30
+
+
+async def test_options_flow_keeps_stream_enabled(hass):
+    """Saving options keeps the switch's persisted stream_enabled state."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="front_door",
+        data=VALID_USER_INPUT,
+        options={CONF_SHOW_VIEWERS: True, "stream_enabled": True},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_SHOW_VIEWERS: False}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"]["stream_enabled"] is True
+
+
+async def test_options_flow_retires_replaced_sub_stream(hass):
+    """Changing the sub stream records the old variant for the reconciler to delete."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="front_door",
+        data=VALID_USER_INPUT,
+        options={CONF_SUB_STREAM: "front_door_sub"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_SUB_STREAM: "front_door_low"}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_RETIRED_STREAMS] == ["front_door_sub"]
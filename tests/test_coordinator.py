@@ -0,0 +1,412 @@
+"""Tests for the SharedCam coordinator's poll post-processing."""
+import base64
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.sharedcam.const import (
+    ADMIT_RESERVATION_TTL,
+    CONF_EVENT_BURST_LIMIT,
+    CONF_MAX_VIEWERS,
+    CONF_SUB_STREAM,
+    CONF_SUB_STREAM_VIEWERS,
+    EVENT_VIEWER_JOINED,
+    EVENT_VIEWER_LEFT,
+    PROBE_USER_AGENT,
+)
+from custom_components.sharedcam.media import h264_sps_info
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def coordinator(make_coordinator):
+    """Return a coordinator with default options."""
+    return make_coordinator()
+
+
+def _stream(producer_recv: int, consumers: dict[int, int]) -> dict:
+    """Build a go2rtc stream entry from producer bytes and {consumer id: bytes sent}."""
+    return {
+        "producers": [{"id": 1, "bytes_recv": producer_recv}],
+        "consumers": [
+            {"id": cid, "bytes_send": sent} for cid, sent in consumers.items()
+        ],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Throughput
+# ---------------------------------------------------------------------------
+
+
+def _poll(coordinator, at: float, stream_data) -> None:
+    with patch(
+        "custom_components.sharedcam.coordinator.time.monotonic", return_value=at
+    ):
+        coordinator._update_throughput(stream_data)
+
+
+async def test_throughput_unknown_until_second_poll(coordinator):
+    """A single poll has nothing to diff against."""
+    _poll(coordinator, 100.0, _stream(1000, {2: 500}))
+    assert coordinator.throughput == {
+        "egress": None,
+        "ingest": None,
+        "per_viewer": None,
+    }
+
+
+async def test_throughput_diffs_consumers_by_id(coordinator):
+    """Stayed viewers count their delta, new viewers their whole counter."""
+    _poll(coordinator, 100.0, _stream(1_000, {2: 500, 3: 900}))
+    # Consumer 3 left, consumer 4 joined.
+    _poll(coordinator, 110.0, _stream(11_000, {2: 10_500, 4: 5_000}))
+
+    assert coordinator.throughput["ingest"] == 10_000 * 8 / 10
+    assert coordinator.throughput["egress"] == 15_000 * 8 / 10
+    assert coordinator.throughput["per_viewer"] == 15_000 * 8 / 10 / 2
+
+
+async def test_throughput_handles_counter_reset(coordinator):
+    """A counter that went backwards (go2rtc restart) is treated as fresh."""
+    _poll(coordinator, 100.0, _stream(50_000, {2: 40_000}))
+    _poll(coordinator, 110.0, _stream(2_000, {2: 1_000}))
+
+    assert coordinator.throughput["ingest"] == 2_000 * 8 / 10
+    assert coordinator.throughput["egress"] == 1_000 * 8 / 10
+
+
+async def test_throughput_zero_when_stream_disabled(coordinator):
+    """An unregistered stream carries no traffic."""
+    _poll(coordinator, 100.0, None)
+    assert coordinator.throughput == {
+        "egress": 0.0,
+        "ingest": 0.0,
+        "per_viewer": 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Source variants
+# ---------------------------------------------------------------------------
+
+
+async def test_sub_stream_consumers_merged(make_coordinator):
+    """Viewers of the sub-stream variant count towards the camera."""
+    coordinator = make_coordinator(options={CONF_SUB_STREAM: "front_door_sub"})
+    raw = {
+        "front_door": _stream(0, {1: 0}),
+        "front_door_sub": _stream(0, {2: 0, 3: 0}),
+    }
+
+    assert coordinator.stream_sources == {
+        "front_door": "rtsp://frigate.example.com:8554/front_door",
+        "front_door_sub": "rtsp://frigate.example.com:8554/front_door_sub",
+    }
+    assert len(coordinator.stream_data_from(raw)["consumers"]) == 3
+    assert coordinator.stream_data_from({"front_door_sub": raw["front_door_sub"]}) is None
+
+
+async def test_active_source_switches_on_viewer_limit(make_coordinator):
+    """New viewers move to the sub stream at the limit and back below hysteresis."""
+    coordinator = make_coordinator(
+        options={CONF_SUB_STREAM: "front_door_sub", CONF_SUB_STREAM_VIEWERS: 5}
+    )
+    raw = {"front_door": _stream(0, dict.fromkeys(range(1, 6), 0))}
+    raw["front_door_sub"] = _stream(0, {})
+    coordinator._update_active_source(coordinator.stream_data_from(raw), raw)
+    assert coordinator.active_source == "front_door_sub"
+
+    # 4 viewers is below the limit but not below 80 % of it — stay on the sub stream.
+    raw["front_door"] = _stream(0, dict.fromkeys(range(1, 5), 0))
+    coordinator._update_active_source(coordinator.stream_data_from(raw), raw)
+    assert coordinator.active_source == "front_door_sub"
+
+    raw["front_door"] = _stream(0, dict.fromkeys(range(1, 4), 0))
+    coordinator._update_active_source(coordinator.stream_data_from(raw), raw)
+    assert coordinator.active_source == "front_door"
+
+
+# ---------------------------------------------------------------------------
+# Viewer events
+# ---------------------------------------------------------------------------
+
+
+def _viewers(*ids: int) -> dict:
+    return {
+        "producers": [],
+        "consumers": [
+            {"id": cid, "remote_addr": f"203.0.113.{cid}", "user_agent": "Firefox"}
+            for cid in ids
+        ],
+    }
+
+
+def _sessions_poll(coordinator, at: float, stream_data) -> None:
+    with patch(
+        "custom_components.sharedcam.coordinator.time.monotonic", return_value=at
+    ):
+        coordinator._update_sessions(stream_data)
+
+
+async def test_viewer_events_from_consumer_diff(hass, make_coordinator):
+    """Joins and leaves since the previous poll fire bus events; the first poll is a baseline."""
+    coordinator = make_coordinator()
+    joined = async_capture_events(hass, EVENT_VIEWER_JOINED)
+    left = async_capture_events(hass, EVENT_VIEWER_LEFT)
+
+    _sessions_poll(coordinator, 0.0, _viewers(1, 2))
+    _sessions_poll(coordinator, 90.0, _viewers(2, 3))
+    await hass.async_block_till_done()
+
+    assert [event.data for event in joined] == [
+        {
+            "camera": "front_door",
+            "consumer_id": 3,
+            "remote_addr": "203.0.113.3",
+            "user_agent": "Firefox",
+        }
+    ]
+    assert [event.data for event in left] == [
+        {
+            "camera": "front_door",
+            "consumer_id": 1,
+            "remote_addr": "203.0.113.1",
+            "user_agent": "Firefox",
+            "duration": 90,
+        }
+    ]
+
+
+async def test_viewer_events_suppressed_above_burst_limit(hass, make_coordinator):
+    """A poll with more changes than the burst limit fires no events."""
+    coordinator = make_coordinator(options={CONF_EVENT_BURST_LIMIT: 2})
+    joined = async_capture_events(hass, EVENT_VIEWER_JOINED)
+
+    _sessions_poll(coordinator, 0.0, _viewers())
+    _sessions_poll(coordinator, 30.0, _viewers(1, 2, 3))
+    await hass.async_block_till_done()
+
+    assert joined == []
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+
+async def test_listeners_skipped_when_nothing_surfaced_changed(coordinator):
+    """Only updates that change a surfaced field reach listeners, naming the fields."""
+    calls: list[frozenset[str]] = []
+    coordinator.async_add_listener(lambda: calls.append(coordinator.changed_fields))
+
+    coordinator.async_set_updated_data(_viewers(1))
+    assert "enabled" in calls[-1]
+    assert "viewers" in calls[-1]
+
+    # Same viewers, different byte counters: no fan-out.
+    coordinator.async_set_updated_data(
+        {**_viewers(1), "producers": [{"id": 9, "bytes_recv": 123}]}
+    )
+    assert len(calls) == 1
+
+    coordinator.async_set_updated_data(_viewers(1, 2))
+    assert calls[-1] == frozenset({"viewers"})
+
+
+# ---------------------------------------------------------------------------
+# Media description
+# ---------------------------------------------------------------------------
+
+SDP = """v=0
+m=video 0 RTP/AVP 96
+a=rtpmap:96 H264/90000
+a=fmtp:96 packetization-mode=1;profile-level-id=640028;sprop-parameter-sets=Z2QAKKzlAeAIn5U=,aO48gA==
+m=audio 0 RTP/AVP 97
+a=rtpmap:97 MPEG4-GENERIC/16000/1
+"""
+
+
+async def test_media_parsed_from_producer_and_kept_while_idle(coordinator):
+    """Codec, profile and frame size come from the SDP and survive an idle producer."""
+    raw = {"front_door": {"producers": [{"id": 1, "sdp": SDP}], "consumers": []}}
+    coordinator._update_media(raw)
+    assert coordinator.media == {
+        "codec": "h264",
+        "profile": "High",
+        "mime": "avc1.640028",
+        "width": 1920,
+        "height": 1080,
+        "audio": "aac",
+        "audio_mime": "mp4a.40.2",
+    }
+
+    # go2rtc disconnects the producer once the last viewer leaves.
+    coordinator._update_media({"front_door": {"producers": [{"url": "rtsp://x"}]}})
+    assert coordinator.media["width"] == 1920
+
+
+def test_sps_resolution():
+    """A Baseline SPS without cropping decodes to its macroblock size."""
+    info = h264_sps_info(base64.b64decode("Z0IAHpWoKA9k"))
+    assert (info["profile_idc"], info["width"], info["height"]) == (66, 640, 480)
+
+
+# ---------------------------------------------------------------------------
+# Admission control
+# ---------------------------------------------------------------------------
+
+
+async def test_admission_counts_viewers_and_reservations(make_coordinator):
+    """Live viewers and reservations take slots until the limit is reached."""
+    coordinator = make_coordinator(options={CONF_MAX_VIEWERS: 3})
+    coordinator.async_set_updated_data(_viewers(1))
+    admission = coordinator.admission
+    assert admission.slots == 2
+
+    assert admission.async_reserve()
+    assert admission.async_reserve()
+    assert admission.slots == 0
+    assert not admission.async_reserve()
+    admission.async_shutdown()
+
+
+async def test_admission_reservation_held_until_a_later_poll(make_coordinator):
+    """A reservation outlives a poll that was already in flight and is released by the next."""
+    coordinator = make_coordinator(options={CONF_MAX_VIEWERS: 3})
+    coordinator.async_set_updated_data(_viewers(1))
+    admission = coordinator.admission
+    viewers = [1]
+
+    async def _request(*_args, **_kwargs):
+        resp = MagicMock()
+        resp.json = AsyncMock(return_value={"front_door": _viewers(*viewers)})
+        return resp
+
+    coordinator._client = MagicMock()
+    coordinator._client._client.request = AsyncMock(side_effect=_request)
+
+    async def _reserve_during_fetch(*_args, **_kwargs):
+        assert admission.async_reserve()
+        return await _request()
+
+    # The viewer reserves while a poll is in flight; that poll cannot see it.
+    coordinator._client._client.request.side_effect = _reserve_during_fetch
+    await coordinator.async_refresh()
+    assert admission.slots == 1
+
+    # The viewer connects but the next poll is up to SCAN_INTERVAL away; the
+    # reservation keeps its slot taken meanwhile.
+    viewers.append(2)
+    with patch(
+        "custom_components.sharedcam.admission.time.monotonic",
+        return_value=time.monotonic() + 15,
+    ):
+        assert admission.slots == 1
+
+    # The next poll counts the viewer and releases the reservation.
+    coordinator._client._client.request.side_effect = _request
+    await coordinator.async_refresh()
+    assert coordinator.viewer_count == 2
+    assert admission.slots == 1
+
+    # A reservation whose viewer never shows up lapses without a poll.
+    assert admission.async_reserve()
+    assert admission.slots == 0
+    with patch(
+        "custom_components.sharedcam.admission.time.monotonic",
+        return_value=time.monotonic() + ADMIT_RESERVATION_TTL,
+    ):
+        assert admission.slots == 1
+    admission.async_shutdown()
+
+
+async def test_admission_unlimited_without_max_viewers(coordinator):
+    """Without a viewer limit there are no slots to report and every viewer is admitted."""
+    assert coordinator.admission.slots is None
+    assert coordinator.admission.async_reserve()
+
+
+# ---------------------------------------------------------------------------
+# Producer stall
+# ---------------------------------------------------------------------------
+
+
+def _stall_poll(coordinator, at: float, producer_recv: int, viewers: int = 1) -> list[str]:
+    raw = {"front_door": _stream(producer_recv, {cid: 0 for cid in range(2, 2 + viewers)})}
+    with patch(
+        "custom_components.sharedcam.coordinator.time.monotonic", return_value=at
+    ):
+        return coordinator._update_stalls(raw)
+
+
+async def test_stall_flagged_when_producer_bytes_stop_with_viewers(coordinator):
+    """A producer counter that stops moving for two polls with viewers attached is a stall."""
+    assert _stall_poll(coordinator, 0.0, 1000) == []
+    assert _stall_poll(coordinator, 30.0, 5000) == []
+    assert _stall_poll(coordinator, 60.0, 5000) == []
+    assert _stall_poll(coordinator, 90.0, 5000) == ["front_door"]
+    assert coordinator.stalled == {"front_door"}
+    assert coordinator.stalls == 1
+
+    # Bytes flowing again clear the stall.
+    assert _stall_poll(coordinator, 120.0, 9000) == []
+    assert not coordinator.stalled
+
+    # An idle counter without viewers is just go2rtc not pulling the source.
+    for at in (150.0, 180.0, 210.0):
+        assert _stall_poll(coordinator, at, 9000, viewers=0) == []
+    assert coordinator.stalls == 1
+
+
+async def test_stall_recovery_reregisters_only_the_stream_with_backoff(coordinator):
+    """Recovery PUTs the stalled stream alone and backs off while it stays stalled."""
+    for at in (0.0, 30.0, 60.0):
+        due = _stall_poll(coordinator, at, 1000)
+    enable = AsyncMock(side_effect=[OSError("go2rtc unreachable"), None])
+    with (
+        patch.object(coordinator, "async_enable_stream", enable),
+        patch("custom_components.sharedcam.coordinator.time.monotonic", return_value=60.0),
+    ):
+        await coordinator._async_recover_stalls(due)
+    enable.assert_awaited_once_with("front_door")
+    assert coordinator.stall_recoveries == 0
+
+    # Still stalled, but the retry waits out the backoff.
+    assert _stall_poll(coordinator, 75.0, 1000) == []
+    due = _stall_poll(coordinator, 95.0, 1000)
+    assert due == ["front_door"]
+    with patch.object(coordinator, "async_enable_stream", enable):
+        await coordinator._async_recover_stalls(due)
+    assert coordinator.stall_recoveries == 1
+    assert coordinator.stalls == 1
+
+
+async def test_probe_ignored_by_throughput_and_stalls(coordinator):
+    """The latency probe adds no egress, no viewer to divide by and no stall watch."""
+
+    def _with_probe(producer_recv: int, viewer_sent: int | None, probe_sent: int) -> dict:
+        stream = _stream(producer_recv, {} if viewer_sent is None else {2: viewer_sent})
+        stream["consumers"].append(
+            {"id": 9, "bytes_send": probe_sent, "user_agent": PROBE_USER_AGENT}
+        )
+        return stream
+
+    _poll(coordinator, 100.0, _with_probe(1_000, 500, 0))
+    _poll(coordinator, 110.0, _with_probe(11_000, 10_500, 80_000))
+    assert coordinator.throughput["egress"] == 10_000 * 8 / 10
+    assert coordinator.throughput["per_viewer"] == 10_000 * 8 / 10
+
+    for at in (0.0, 30.0, 60.0, 90.0):
+        raw = {"front_door": _with_probe(5_000, None, 0)}
+        with patch(
+            "custom_components.sharedcam.coordinator.time.monotonic", return_value=at
+        ):
+            assert coordinator._update_stalls(raw) == []
+    assert not coordinator.stalled
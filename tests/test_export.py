@@ -0,0 +1,73 @@
+"""Tests for SharedCam's static status export."""
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+from custom_components.sharedcam.export import SharedCamStatusExporter
+
+
+async def test_export_writes_changes_only(hass, tmp_path, make_coordinator):
+    """The payload is written to status/<camera>.json, and only when it changes."""
+    coordinator = make_coordinator()
+    exporter = SharedCamStatusExporter(hass, coordinator, str(tmp_path))
+    path = tmp_path / "status" / "front_door.json"
+
+    await exporter._async_write(None)
+    assert json.loads(path.read_text())["available"] is False
+
+    mtime = path.stat().st_mtime_ns
+    await exporter._async_write(None)
+    assert path.stat().st_mtime_ns == mtime
+
+    coordinator.data = {"producers": [], "consumers": [{"id": 1}]}
+    await exporter._async_write(None)
+    assert json.loads(path.read_text()) == {
+        "available": True,
+        "source": "front_door",
+        "viewers": 1,
+    }
+    # No temp files are left behind.
+    assert [p.name for p in path.parent.iterdir()] == ["front_door.json"]
+
+
+async def test_export_writes_are_serialised(hass, tmp_path, make_coordinator):
+    """A change during a slow write waits for it, so the newest payload lands last."""
+    coordinator = make_coordinator()
+    exporter = SharedCamStatusExporter(hass, coordinator, str(tmp_path))
+    active = peak = 0
+    written: list[dict] = []
+
+    def _slow_write(path, content: bytes) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        time.sleep(0.05)
+        written.append(json.loads(content))
+        active -= 1
+
+    with patch("custom_components.sharedcam.export._write_atomic", _slow_write):
+        first = hass.async_create_task(exporter._async_write(None))
+        await asyncio.sleep(0)
+        coordinator.data = {"producers": [], "consumers": []}
+        await exporter._async_write(None)
+        await first
+
+    assert peak == 1
+    assert [payload["available"] for payload in written] == [False, True]
+
+
+async def test_export_stop_writes_unavailable(hass, tmp_path, make_coordinator):
+    """Stopping the exporter leaves an offline status behind, not the last live one."""
+    coordinator = make_coordinator()
+    coordinator.data = {"producers": [], "consumers": [{"id": 1}]}
+    exporter = SharedCamStatusExporter(hass, coordinator, str(tmp_path))
+    path = tmp_path / "status" / "front_door.json"
+
+    stop = exporter.async_start()
+    await exporter._async_write(None)
+    assert json.loads(path.read_text())["available"] is True
+
+    stop()
+    await hass.async_block_till_done()
+    assert json.loads(path.read_text())["available"] is False
@@ -0,0 +1,93 @@
+"""Tests for viewer presence from the Caddy log."""
+import asyncio
+import json
+import socket
+
+import pytest
+
+from custom_components.sharedcam.presence import PresenceIngester, parse_tcp_source
+
+
+@pytest.fixture
+def coordinator(make_coordinator):
+    """Return a coordinator whose last poll counted one viewer."""
+    coordinator = make_coordinator()
+    coordinator.async_set_updated_data({"producers": [], "consumers": [{"id": 1}]})
+    return coordinator
+
+
+def _line(port: int, *, opened: bool, src: str = "front_door") -> bytes:
+    """Build a Caddy JSON log line for a viewer WebSocket open or close."""
+    request = {"remote_ip": "203.0.113.7", "remote_port": str(port), "uri": f"/api/ws?src={src}"}
+    if opened:
+        entry = {"msg": "upstream roundtrip", "status": 101, "request": request}
+    else:
+        entry = {"logger": "http.log.access.log0", "msg": "handled request", "request": request}
+    return json.dumps(entry).encode() + b"\n"
+
+
+async def test_opens_and_closes_adjust_viewer_count(hass, coordinator):
+    """Opens add viewers, matched closes remove them, and partial lines wait."""
+    ingester = PresenceIngester(hass, "/logs/access.log")
+    ingester.coordinators.add(coordinator)
+
+    data = (
+        _line(1000, opened=True)
+        + _line(1001, opened=True)
+        + _line(1002, opened=True, src="back_yard")
+        # A close without a matching open was already counted by the poll.
+        + _line(999, opened=False)
+    )
+    partial = _line(1003, opened=True)
+    remainder = ingester._async_feed(data + partial[:20])
+    assert coordinator.viewer_count == 3
+    assert coordinator.changed_fields == frozenset({"viewers"})
+
+    ingester._async_feed(remainder + partial[20:] + _line(1000, opened=False))
+    ingester._async_feed(_line(1001, opened=False))
+    assert coordinator.viewer_count == 2
+
+
+async def test_presence_ignored_while_disabled(coordinator):
+    """A stream that is not registered has no viewers, whatever Caddy logged."""
+    coordinator.async_set_updated_data(None)
+    coordinator.async_presence_changed(1)
+    assert coordinator.viewer_count == 0
+
+
+async def test_tcp_listener_stops_with_writer_connected(hass, coordinator):
+    """Stopping the listener drops Caddy's open connection instead of waiting on it."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    ingester = PresenceIngester(hass, f"tcp://127.0.0.1:{port}")
+    ingester.coordinators.add(coordinator)
+    serve = hass.async_create_task(ingester._async_serve("127.0.0.1", port))
+
+    for _ in range(50):
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            break
+        except OSError:
+            await asyncio.sleep(0.01)
+    writer.write(_line(1000, opened=True))
+    await writer.drain()
+    async with asyncio.timeout(5):
+        while coordinator.viewer_count != 2:
+            await asyncio.sleep(0.01)
+
+    serve.cancel()
+    async with asyncio.timeout(5):
+        await asyncio.gather(serve, return_exceptions=True)
+    assert await reader.read() == b""
+    assert not ingester._writers
+    writer.close()
+
+
+async def test_tcp_source_parsing():
+    """tcp:// sources need a valid port; a blank host listens everywhere."""
+    assert parse_tcp_source("tcp://0.0.0.0:5140") == ("0.0.0.0", 5140)
+    assert parse_tcp_source("tcp://:5140") == ("0.0.0.0", 5140)
+    assert parse_tcp_source("tcp://[::]:5140") == ("::", 5140)
+    assert parse_tcp_source("tcp://host:70000") is None
+    assert parse_tcp_source("/logs/access.log") is None
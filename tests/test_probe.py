@@ -0,0 +1,68 @@
+"""Tests for the synthetic latency probe against a fake go2rtc WebSocket."""
+import asyncio
+
+from aiohttp import ClientSession, web
+import pytest
+
+from custom_components.sharedcam.const import PROBE_USER_AGENT
+from custom_components.sharedcam.coordinator import _consumer_count
+from custom_components.sharedcam.probe import ProbeError, async_probe_stream
+
+
+async def _fake_ws(request: web.Request) -> web.WebSocketResponse:
+    """Answer an MSE request like go2rtc: codecs, init segment, media segments."""
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    assert request.headers["User-Agent"] == PROBE_USER_AGENT
+    assert (await ws.receive_json())["type"] == "mse"
+
+    if request.query["src"] == "missing":
+        await ws.send_json({"type": "error", "value": "streams: stream not found"})
+    elif request.query["src"] == "front_door":
+        await ws.send_json({"type": "mse", "value": 'video/mp4; codecs="avc1.640029"'})
+        await ws.send_bytes(b"ftyp+moov")
+        await ws.send_bytes(b"moof+mdat")
+        await asyncio.sleep(1)
+    await ws.close()
+    return ws
+
+
+@pytest.fixture
+async def go2rtc_url(socket_enabled):
+    """Serve the fake go2rtc WebSocket on a local port."""
+    app = web.Application()
+    app.router.add_get("/api/ws", _fake_ws)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+async def test_probe_times_milestones(go2rtc_url):
+    """Connect, init and first media segment are timed in order."""
+    async with ClientSession() as session:
+        latency = await async_probe_stream(session, go2rtc_url, "front_door")
+    assert set(latency) == {"connect", "init", "first_frame"}
+    assert 0 <= latency["connect"] <= latency["init"] <= latency["first_frame"]
+
+
+@pytest.mark.parametrize("source", ["missing", "silent"])
+async def test_probe_fails_without_media(go2rtc_url, source):
+    """go2rtc errors and closes before any media raise ProbeError."""
+    async with ClientSession() as session:
+        with pytest.raises(ProbeError):
+            await async_probe_stream(session, go2rtc_url, source)
+
+
+def test_probe_not_counted_as_viewer():
+    """The probe's consumer is excluded from the viewer count."""
+    stream = {
+        "consumers": [
+            {"id": 1, "user_agent": "Mozilla/5.0"},
+            {"id": 2, "user_agent": PROBE_USER_AGENT},
+        ]
+    }
+    assert _consumer_count(stream) == 1
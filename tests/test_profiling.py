@@ -0,0 +1,41 @@
+"""Tests for the sharedcam.profile service."""
+import asyncio
+
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.sharedcam.const import DOMAIN, SERVICE_PROFILE
+from custom_components.sharedcam.profiling import (
+    async_get_profiler,
+    async_register_profile_service,
+)
+
+
+async def test_profile_run(hass, tmp_path):
+    """A run writes a .prof file, refuses to overlap and records SSE phases while active."""
+    hass.config.config_dir = str(tmp_path)
+    hass.data.setdefault(DOMAIN, {})
+    async_register_profile_service(hass)
+    profiler = async_get_profiler(hass)
+
+    # Timings reported outside a run are dropped.
+    profiler.record_sse(1.0, 1.0, 1.0, 1.0)
+    assert profiler._phases == {}
+
+    run = hass.async_create_task(profiler.async_run(0.05))
+    await asyncio.sleep(0)
+    assert profiler.active
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE, {"seconds": 1}, blocking=True
+        )
+
+    profiler.record_sse(0.001, 0.002, 0.003, 0.004)
+    await run
+    assert not profiler.active
+    assert profiler._phases["write"] == [0.004, 1]
+
+    profiler.record_sse(1.0, 1.0, 1.0, 1.0)
+    assert profiler._phases["write"] == [0.004, 1]
+    assert len(list(tmp_path.glob("sharedcam_profile.*.prof"))) == 1
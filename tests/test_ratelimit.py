@@ -0,0 +1,55 @@
+"""Tests for SharedCam request throttling."""
+from unittest.mock import patch
+
+from aiohttp.test_utils import make_mocked_request
+
+from custom_components.sharedcam.const import (
+    CLIENT_ADDRESS_HEADER,
+    RATE_LIMIT_BURST,
+    SSE_MAX_STREAMS,
+)
+from custom_components.sharedcam.ratelimit import SharedCamRateLimiter
+
+
+def _request(client: str):
+    return make_mocked_request(
+        "GET", "/api/sharedcam/status/front_door", headers={CLIENT_ADDRESS_HEADER: client}
+    )
+
+
+def test_burst_then_429_with_retry_after():
+    """A client may burst, then gets a 429 until its bucket refills."""
+    limiter = SharedCamRateLimiter()
+    with patch(
+        "custom_components.sharedcam.ratelimit.time.monotonic", return_value=100.0
+    ):
+        for _ in range(RATE_LIMIT_BURST):
+            assert limiter.check(_request("203.0.113.7"), "front_door") is None
+        limited = limiter.check(_request("203.0.113.7"), "front_door")
+
+        # Other clients and other cameras have their own buckets.
+        assert limiter.check(_request("203.0.113.8"), "front_door") is None
+        assert limiter.check(_request("203.0.113.7"), "back_yard") is None
+
+    assert limited is not None
+    assert limited.status == 429
+    assert int(limited.headers["Retry-After"]) >= 1
+
+    with patch(
+        "custom_components.sharedcam.ratelimit.time.monotonic", return_value=110.0
+    ):
+        assert limiter.check(_request("203.0.113.7"), "front_door") is None
+
+
+def test_sse_stream_cap():
+    """Open SSE streams are capped globally and slots are released on close."""
+    limiter = SharedCamRateLimiter()
+    for _ in range(SSE_MAX_STREAMS):
+        assert limiter.open_stream() is None
+
+    rejected = limiter.open_stream()
+    assert rejected is not None
+    assert rejected.status == 503
+
+    limiter.close_stream()
+    assert limiter.open_stream() is None
@@ -0,0 +1,177 @@
+"""Tests for the desired-state reconciler."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.sharedcam.const import (
+    CONF_RETIRED_STREAMS,
+    CONF_STREAM_ENABLED,
+    RECONCILE_BACKOFF_MIN,
+    RESTART_MIN_STREAMS,
+)
+
+ENABLED = {CONF_STREAM_ENABLED: True}
+
+
+def _live() -> dict:
+    return {"producers": [], "consumers": [{"id": 1}]}
+
+
+@pytest.fixture
+def add_camera(make_coordinator):
+    """Return a factory for registered coordinators with go2rtc calls mocked out."""
+
+    def _add(camera_name: str, options: dict | None = None):
+        coordinator = make_coordinator(camera_name, options)
+        coordinator.async_enable_stream = AsyncMock()
+        coordinator.async_remove_stream = AsyncMock()
+        coordinator.reconciler.async_register(coordinator)
+        return coordinator
+
+    return _add
+
+
+async def test_restart_detected_from_mass_disappearance(add_camera):
+    """RESTART_MIN_STREAMS vanished streams count as a go2rtc restart; one does not."""
+    names = [f"cam{i}" for i in range(RESTART_MIN_STREAMS + 1)]
+    cameras = [add_camera(name, ENABLED) for name in names]
+    reconciler = cameras[0].reconciler
+
+    await reconciler.async_reconcile({name: _live() for name in names}, cameras[0])
+    assert reconciler.restarts == 0
+
+    # A single stream going missing is an isolated removal.
+    raw = {name: _live() for name in names[1:]}
+    await reconciler.async_reconcile(raw, cameras[1])
+    assert reconciler.restarts == 0
+    cameras[0].async_enable_stream.assert_awaited_once_with("cam0")
+
+    raw = {names[0]: _live()}
+    await reconciler.async_reconcile(raw, cameras[0])
+    assert reconciler.restarts == 1
+    assert set(raw) == set(names)
+
+
+async def test_restart_detected_when_the_only_stream_vanishes(add_camera):
+    """A host whose every enabled stream disappears counts as restarted."""
+    camera = add_camera("front_door", ENABLED)
+    reconciler = camera.reconciler
+
+    await reconciler.async_reconcile({"front_door": _live()}, camera)
+    raw: dict = {}
+    await reconciler.async_reconcile(raw, camera)
+    assert reconciler.restarts == 1
+    assert raw == {"front_door": {"producers": [], "consumers": []}}
+    assert camera.repairs == 1
+
+
+async def test_failed_repair_backs_off(add_camera):
+    """A failed repair is not retried until its backoff has passed."""
+    camera = add_camera("front_door", ENABLED)
+    camera.async_enable_stream.side_effect = OSError("go2rtc unreachable")
+    reconciler = camera.reconciler
+
+    def _reconcile_at(at: float):
+        with patch(
+            "custom_components.sharedcam.reconciler.time.monotonic", return_value=at
+        ):
+            return reconciler.async_reconcile({}, camera)
+
+    await _reconcile_at(100.0)
+    assert camera.async_enable_stream.await_count == 1
+    assert camera.repairs == 0
+
+    await _reconcile_at(100.0 + RECONCILE_BACKOFF_MIN - 1)
+    assert camera.async_enable_stream.await_count == 1
+
+    await _reconcile_at(100.0 + RECONCILE_BACKOFF_MIN)
+    assert camera.async_enable_stream.await_count == 2
+
+    # The second failure doubles the wait.
+    await _reconcile_at(100.0 + RECONCILE_BACKOFF_MIN * 2)
+    assert camera.async_enable_stream.await_count == 2
+
+    camera.async_enable_stream.side_effect = None
+    await _reconcile_at(100.0 + RECONCILE_BACKOFF_MIN * 3)
+    assert camera.async_enable_stream.await_count == 3
+    assert camera.repairs == 1
+
+
+async def test_stale_stream_removed(add_camera):
+    """A stream present in go2rtc but disabled in HA is deleted."""
+    camera = add_camera("front_door", {CONF_STREAM_ENABLED: False})
+    raw = {"front_door": _live(), "other": _live()}
+
+    await camera.reconciler.async_reconcile(raw, camera)
+    camera.async_remove_stream.assert_awaited_once_with("front_door")
+    assert set(raw) == {"other"}
+    assert camera.repairs == 1
+
+
+async def test_retired_variant_removed_and_forgotten(add_camera):
+    """A sub stream dropped from the options is deleted once, then forgotten."""
+    camera = add_camera(
+        "front_door",
+        {**ENABLED, CONF_RETIRED_STREAMS: ["front_door_old", "front_door_gone"]},
+    )
+    raw = {"front_door": _live(), "front_door_old": _live()}
+
+    await camera.reconciler.async_reconcile(raw, camera)
+    camera.async_remove_stream.assert_awaited_once_with("front_door_old")
+    assert set(raw) == {"front_door"}
+    assert CONF_RETIRED_STREAMS not in camera.config_entry.options
+    assert camera.config_entry.options[CONF_STREAM_ENABLED] is True
+
+
+async def test_busy_camera_skipped(add_camera):
+    """Streams of a camera whose switch is mid-request are left alone."""
+    camera = add_camera("front_door", ENABLED)
+
+    async with camera._stream_lock:
+        assert camera.stream_busy
+        await camera.reconciler.async_reconcile({}, camera)
+    camera.async_enable_stream.assert_not_awaited()
+    assert camera.repairs == 0
+
+
+async def test_repaired_state_pushed_to_other_coordinators(add_camera):
+    """Cameras repaired during another camera's poll get their new state directly."""
+    front = add_camera("front_door", ENABLED)
+    back = add_camera("back_yard", ENABLED)
+    front.async_set_updated_data(_live())
+    listener_calls: list[str] = []
+    front.async_add_listener(lambda: listener_calls.append("front"))
+    back.async_add_listener(lambda: listener_calls.append("back"))
+
+    raw = {"front_door": _live()}
+    await front.reconciler.async_reconcile(raw, front)
+    assert back.data == {"producers": [], "consumers": []}
+    assert listener_calls == ["back"]
+    assert "back_yard" in raw
+
+
+async def test_poll_during_batch_waits_for_repairs(add_camera):
+    """A poll arriving mid-batch waits and sees the batch's repairs, not its stale snapshot."""
+    front = add_camera("front_door", ENABLED)
+    back = add_camera("back_yard", ENABLED)
+    release = asyncio.Event()
+
+    async def _slow_enable(name=None):
+        await release.wait()
+
+    front.async_enable_stream.side_effect = _slow_enable
+    back.async_enable_stream.side_effect = _slow_enable
+    reconciler = front.reconciler
+
+    batch = asyncio.create_task(reconciler.async_reconcile({}, front))
+    await asyncio.sleep(0)
+    stale: dict = {}
+    waiter = asyncio.create_task(reconciler.async_reconcile(stale, back))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    release.set()
+    await asyncio.gather(batch, waiter)
+    assert set(stale) == {"front_door", "back_yard"}
+    assert back.async_enable_stream.await_count == 1
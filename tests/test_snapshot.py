@@ -0,0 +1,123 @@
+"""Tests for the poster frame cache and the snapshot view."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.setup import async_setup_component
+import pytest
+
+from custom_components.sharedcam.const import SNAPSHOT_TTL
+from custom_components.sharedcam.snapshot import Snapshot, SnapshotCache
+from custom_components.sharedcam.views import SharedCamSnapshotView
+
+FRAME = b"\xff\xd8jpeg\xff\xd9"
+
+
+@pytest.fixture
+def coordinator(make_coordinator):
+    """Return a shared camera whose frame grabs are mocked out."""
+    coordinator = make_coordinator()
+    coordinator.async_set_updated_data({"producers": [], "consumers": []})
+    coordinator.async_fetch_frame = AsyncMock(return_value=FRAME)
+    return coordinator
+
+
+def _at(monotonic: float):
+    return patch(
+        "custom_components.sharedcam.snapshot.time.monotonic", return_value=monotonic
+    )
+
+
+async def test_concurrent_requests_share_one_fetch(hass, coordinator):
+    """Callers arriving while a grab is in flight wait for it instead of starting their own."""
+    release = asyncio.Event()
+
+    async def _slow_fetch():
+        await release.wait()
+        return FRAME
+
+    coordinator.async_fetch_frame.side_effect = _slow_fetch
+    cache = SnapshotCache(hass)
+
+    waiters = [hass.async_create_task(cache.async_get(coordinator)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    snapshots = await asyncio.gather(*waiters)
+
+    assert coordinator.async_fetch_frame.await_count == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert not cache._inflight
+
+
+async def test_frame_refetched_after_ttl(hass, coordinator):
+    """A cached frame is served until SNAPSHOT_TTL has passed."""
+    cache = SnapshotCache(hass)
+    with _at(100.0):
+        first = await cache.async_get(coordinator)
+    with _at(100.0 + SNAPSHOT_TTL - 1):
+        assert await cache.async_get(coordinator) is first
+        assert first.max_age == 1
+    with _at(100.0 + SNAPSHOT_TTL):
+        assert await cache.async_get(coordinator) is not first
+    assert coordinator.async_fetch_frame.await_count == 2
+
+
+async def test_least_recently_used_evicted_over_budget(hass):
+    """Frames beyond the byte budget are evicted oldest-used first."""
+    cache = SnapshotCache(hass)
+    with patch("custom_components.sharedcam.snapshot.SNAPSHOT_MAX_BYTES", 20):
+        cache._store("a", Snapshot(b"a" * 8))
+        cache._store("b", Snapshot(b"b" * 8))
+        cache._entries.move_to_end("a")
+        cache._store("c", Snapshot(b"c" * 8))
+
+    assert list(cache._entries) == ["a", "c"]
+    assert cache._size == 16
+
+
+async def test_oversized_frame_served_but_not_cached(hass, coordinator):
+    """A frame above SNAPSHOT_MAX_FRAME_BYTES reaches the caller but is never kept."""
+    cache = SnapshotCache(hass)
+    with patch(
+        "custom_components.sharedcam.snapshot.SNAPSHOT_MAX_FRAME_BYTES", len(FRAME) - 1
+    ):
+        snapshot = await cache.async_get(coordinator)
+        await cache.async_get(coordinator)
+
+    assert snapshot.frame == FRAME
+    assert not cache._entries
+    assert cache._size == 0
+    assert coordinator.async_fetch_frame.await_count == 2
+
+
+async def test_hung_fetch_times_out(hass, coordinator):
+    """A grab go2rtc never answers fails its waiters and frees the camera's slot."""
+    coordinator.async_fetch_frame.side_effect = asyncio.Event().wait
+    cache = SnapshotCache(hass)
+
+    with (
+        patch("custom_components.sharedcam.snapshot.SNAPSHOT_FETCH_TIMEOUT", 0.01),
+        pytest.raises(TimeoutError),
+    ):
+        await cache.async_get(coordinator)
+    assert not cache._inflight
+
+
+async def test_view_revalidates_with_etag(hass, hass_client, coordinator):
+    """The view returns the frame with an ETag and a bodiless 304 when it matches."""
+    assert await async_setup_component(hass, "http", {})
+    hass.http.register_view(SharedCamSnapshotView())
+    client = await hass_client()
+
+    resp = await client.get("/api/sharedcam/snapshot/front_door")
+    assert resp.status == 200
+    assert resp.content_type == "image/jpeg"
+    assert await resp.read() == FRAME
+    etag = resp.headers["ETag"]
+
+    resp = await client.get(
+        "/api/sharedcam/snapshot/front_door", headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+    assert await resp.read() == b""
+    assert coordinator.async_fetch_frame.await_count == 1
@@ -0,0 +1,73 @@
+"""Tests for the shared SSE keepalive ticker."""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.sharedcam.const import CONF_SSE_KEEPALIVE
+from custom_components.sharedcam.sse import KEEPALIVE_FRAME, SSEChannel
+
+
+def _response(write_error: Exception | None = None) -> MagicMock:
+    response = MagicMock()
+    response.write = AsyncMock(side_effect=write_error)
+    return response
+
+
+@pytest.fixture
+def coordinator(make_coordinator):
+    """Return a coordinator with a 10 s keepalive period."""
+    return make_coordinator(options={CONF_SSE_KEEPALIVE: 10})
+
+
+async def test_ticker_runs_only_while_subscribed(hass, coordinator):
+    """The first subscriber starts the camera's ticker and the last one stops it."""
+    channel = SSEChannel(hass, "front_door")
+    first = channel.async_add(_response(), coordinator)
+    second = channel.async_add(_response(), coordinator)
+    assert channel._unsub_timer is not None
+
+    channel.async_remove(first)
+    assert channel._unsub_timer is not None
+    channel.async_remove(second)
+    assert channel._unsub_timer is None
+
+
+async def test_tick_skips_recent_and_in_flight_subscribers(hass, coordinator):
+    """Only subscribers idle since mid-period with no write pending are woken."""
+    channel = SSEChannel(hass, "front_door")
+    with patch("custom_components.sharedcam.sse.time.monotonic", return_value=100.0):
+        idle = channel.async_add(_response(), coordinator)
+        recent = channel.async_add(_response(), coordinator)
+        stuck = channel.async_add(_response(), coordinator)
+    recent.last_write = 104.0
+    stuck.writing = True
+
+    with patch("custom_components.sharedcam.sse.time.monotonic", return_value=106.0):
+        channel._async_tick(None)
+    assert idle.keepalive_due
+    assert idle.change_event.is_set()
+    assert not recent.change_event.is_set()
+    assert not stuck.change_event.is_set()
+
+    # The handler loop writes the keepalive, which resets the request.
+    assert await idle.async_send(KEEPALIVE_FRAME)
+    idle.response.write.assert_awaited_once_with(KEEPALIVE_FRAME)
+    assert not idle.keepalive_due
+    channel.async_remove(idle)
+    channel.async_remove(recent)
+    channel.async_remove(stuck)
+
+
+async def test_closed_client_marked_and_skipped(hass, coordinator):
+    """A write to a departed client marks it closed, and ticks leave it alone."""
+    channel = SSEChannel(hass, "front_door")
+    subscriber = channel.async_add(_response(ConnectionResetError()), coordinator)
+
+    assert not await subscriber.async_send(KEEPALIVE_FRAME)
+    assert subscriber.closed
+    assert not subscriber.writing
+
+    subscriber.last_write = 0.0
+    channel._async_tick(None)
+    assert not subscriber.change_event.is_set()
+    channel.async_remove(subscriber)
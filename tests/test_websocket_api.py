@@ -0,0 +1,103 @@
+"""Tests for the SharedCam websocket status subscriptions."""
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.sharedcam.const import (
+    CONF_CAMERA_NAME,
+    CONF_FRIGATE_URL,
+    CONF_GO2RTC_URL,
+    DOMAIN,
+)
+from custom_components.sharedcam.coordinator import SharedCamCoordinator
+from custom_components.sharedcam.websocket_api import async_register_websocket_commands
+
+
+async def test_subscribe_status(hass, hass_ws_client, make_coordinator):
+    """The current payload is sent on subscribe and again when it changes."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_register_websocket_commands(hass)
+    coordinator = make_coordinator("front_door")
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "sharedcam/subscribe_status", "camera": "front_door"}
+    )
+    assert (await client.receive_json())["success"]
+    assert (await client.receive_json())["event"]["available"] is False
+
+    coordinator.async_set_updated_data({"producers": [], "consumers": [{"id": 1}]})
+    assert (await client.receive_json())["event"] == {
+        "available": True,
+        "source": "front_door",
+        "viewers": 1,
+    }
+
+    await client.send_json_auto_id(
+        {"type": "sharedcam/subscribe_status", "camera": "back_yard"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_subscribe_all(hass, hass_ws_client, make_coordinator):
+    """Events for every camera are keyed by camera name."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    async_register_websocket_commands(hass)
+    make_coordinator("front_door")
+    back_yard = make_coordinator("back_yard")
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "sharedcam/subscribe_all"})
+    assert (await client.receive_json())["success"]
+    initial = {}
+    for _ in range(2):
+        initial.update((await client.receive_json())["event"]["cameras"])
+    assert set(initial) == {"front_door", "back_yard"}
+
+    back_yard.async_set_updated_data({"producers": [], "consumers": []})
+    assert (await client.receive_json())["event"] == {
+        "cameras": {"back_yard": {"available": True, "source": "back_yard", "viewers": 0}}
+    }
+
+
+async def test_subscriptions_end_on_reload(hass, hass_ws_client):
+    """Reloading a camera's entry ends its subscriptions so clients resubscribe."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="front_door",
+        data={
+            CONF_GO2RTC_URL: "http://go2rtc.example.com:1984",
+            CONF_FRIGATE_URL: "rtsp://frigate.example.com:8554",
+            CONF_CAMERA_NAME: "front_door",
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch.object(
+        SharedCamCoordinator,
+        "_async_update_data",
+        AsyncMock(return_value={"producers": [], "consumers": []}),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        client = await hass_ws_client(hass)
+
+        await client.send_json_auto_id(
+            {"type": "sharedcam/subscribe_status", "camera": "front_door"}
+        )
+        assert (await client.receive_json())["success"]
+        assert (await client.receive_json())["event"]["available"] is True
+        await client.send_json_auto_id({"type": "sharedcam/subscribe_all"})
+        assert (await client.receive_json())["success"]
+        assert "front_door" in (await client.receive_json())["event"]["cameras"]
+
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    errors = [await client.receive_json() for _ in range(2)]
+    assert {msg["id"] for msg in errors} == {1, 2}
+    for msg in errors:
+        assert not msg["success"]
+        assert msg["error"]["code"] == "entry_unloaded"